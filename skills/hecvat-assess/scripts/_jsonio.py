@@ -0,0 +1,38 @@
+"""Shared JSON file helpers preferring orjson over stdlib json.
+
+Every script used to carry its own orjson-with-fallback block; this module
+centralizes that choice so the fast path (C-level parse/serialize over raw
+bytes) is picked once. Named _jsonio rather than _json because CPython's
+json module imports its own C accelerator as ``_json`` — shadowing that
+name would break stdlib json entirely.
+"""
+
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def load(path):
+        """Parse the JSON file at path."""
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def dump(obj, path, indent=False):
+        """Serialize obj as JSON to path; indent selects 2-space pretty form."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+except ImportError:
+    loads = json.loads
+
+    def load(path):
+        """Parse the JSON file at path."""
+        with open(path) as f:
+            return json.load(f)
+
+    def dump(obj, path, indent=False):
+        """Serialize obj as JSON to path; indent selects 2-space pretty form."""
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
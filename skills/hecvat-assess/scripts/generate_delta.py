@@ -11,66 +11,138 @@ Outputs:
     - Score delta by category
 """
 
-import json
+import functools
+import io
+import pickle
+import re
 import sys
 import os
 from collections import defaultdict
 
+from _jsonio import load as _load_json
+
+
+# The answer value space is effectively this tiny enum; remapping parsed
+# values onto interned singletons collapses the duplicate allocations a JSON
+# parse produces and lets the comparisons below short-circuit on identity
+_ANSWER_INTERN = {s: sys.intern(s) for s in ("Yes", "No", "", "N/A")}
+
+# Fallback weights parser: one multiline regex over the whole file replaces
+# the per-line strip/startswith/endswith dispatch. Matches indented category
+# headers like "  AAAI:" followed by their "weight: N" entry.
+_WEIGHT_RE = re.compile(
+    r"^\s*(?P<cat>[A-Z]{2,4}):\s*$|^\s*weight:\s*(?P<w>\d+)\s*$", re.M)
+
 
 def load_weights(weights_path: str) -> dict:
-    """Load category weights from scoring-weights.yaml."""
+    """Load category weights from scoring-weights.yaml.
+
+    Results are memoized per (path, mtime) so batch delta runs that compare
+    many snapshots don't re-read and re-parse the same weights file, and a
+    pickle sidecar next to the YAML carries the parse across processes.
+    """
+    return _load_weights_cached(weights_path, os.path.getmtime(weights_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_weights_cached(weights_path: str, _mtime: float) -> dict:
+    # Steady state skips YAML parsing entirely: a <weights>.pkl sidecar holds
+    # the parsed dict and is trusted while at least as new as the YAML. The
+    # cache is best-effort — any failure falls through to a fresh parse, and
+    # an unwritable directory just means no sidecar next time.
+    cache_path = weights_path + ".pkl"
+    try:
+        if os.path.getmtime(cache_path) >= _mtime:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    weights = _parse_weights(weights_path)
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(weights, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return weights
+
+
+def _parse_weights(weights_path: str) -> dict:
     try:
         import yaml
     except ImportError:
-        # Fallback: parse the simple YAML structure manually
+        # Fallback: extract category/weight pairs with a single regex pass
         weights = {}
         with open(weights_path) as f:
-            current_cat = None
-            for line in f:
-                line = line.strip()
-                if line.endswith(':') and not line.startswith('#') and not line.startswith('-'):
-                    key = line[:-1].strip()
-                    if key.isupper() and 2 <= len(key) <= 4:
-                        current_cat = key
-                elif current_cat and line.startswith('weight:'):
-                    weights[current_cat] = int(line.split(':')[1].strip())
-                    current_cat = None
-                elif line == '' or line.startswith('#'):
-                    if not (current_cat and line == ''):
-                        current_cat = None
+            text = f.read()
+        current_cat = None
+        for m in _WEIGHT_RE.finditer(text):
+            cat = m.group('cat')
+            if cat:
+                current_cat = cat
+            elif current_cat:
+                weights[current_cat] = int(m.group('w'))
+                current_cat = None
         return weights
 
+    # Prefer the libyaml-backed C loader when available — same output as
+    # safe_load but without the pure-Python scanner/parser overhead
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(weights_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=loader)
     return {
         cat: info['weight']
         for cat, info in data.get('category_weights', {}).items()
     }
 
 
-def generate_delta(before_path, after_path, weights_path, output_path=None):
-    """Compare two assessments and generate a delta report."""
-    with open(before_path) as f:
-        before = json.load(f)
-    with open(after_path) as f:
-        after = json.load(f)
+def _generate_delta_core(before, after, weights):
+    """Render the delta report for two already-loaded assessment dicts.
 
+    Pure compute — no file I/O — so in-memory callers (and the tests) can
+    diff assessments without the JSON write/read round-trip that the
+    path-based wrapper below exists for.
+    """
     before_answers = before.get("answers", {})
     after_answers = after.get("answers", {})
 
-    weights = load_weights(weights_path)
-
     improvements = []  # No -> Yes
     regressions = []   # Yes -> No
     newly_assessed = []  # blank -> Yes/No
     unchanged_yes = 0
     unchanged_no = 0
 
-    all_qids = sorted(set(list(before_answers.keys()) + list(after_answers.keys())))
+    # Keys-view union dedupes in C without materializing intermediate lists;
+    # sorted output keeps the report deterministic
+    all_qids = sorted(before_answers.keys() | after_answers.keys())
+
+    # Category prefix per question, computed once up front — the small set of
+    # category strings is deduplicated by interning instead of re-splitting
+    # the id everywhere it is needed
+    qid_to_cat = {qid: qid.rpartition("-")[0] or qid for qid in all_qids}
+
+    # Per-category score accumulators, filled in the same pass as the
+    # classification below so each answer is looked up and stripped once
+    cat_deltas = defaultdict(lambda: {"before_yes": 0, "before_total": 0, "after_yes": 0, "after_total": 0})
+
+    before_get = before_answers.get
+    after_get = after_answers.get
 
     for qid in all_qids:
-        b = before_answers.get(qid, {}).get("answer", "").strip()
-        a = after_answers.get(qid, {}).get("answer", "").strip()
+        b = before_get(qid, {}).get("answer", "").strip()
+        a = after_get(qid, {}).get("answer", "").strip()
+        b = _ANSWER_INTERN.get(b, b)
+        a = _ANSWER_INTERN.get(a, a)
+
+        d = cat_deltas[qid_to_cat[qid]]
+        if b in ("Yes", "No"):
+            d["before_total"] += 1
+            if b == "Yes":
+                d["before_yes"] += 1
+        if a in ("Yes", "No"):
+            d["after_total"] += 1
+            if a == "Yes":
+                d["after_yes"] += 1
 
         if b == a:
             if a == "Yes":
@@ -86,89 +158,77 @@ def generate_delta(before_path, after_path, weights_path, output_path=None):
         elif b in ("", "N/A") and a in ("Yes", "No"):
             newly_assessed.append((qid, a))
 
-    # Compute score deltas by category
-    cat_deltas = defaultdict(lambda: {"before_yes": 0, "before_total": 0, "after_yes": 0, "after_total": 0})
-
-    for qid in all_qids:
-        cat = qid.rsplit("-", 1)[0] if "-" in qid else qid
-        b = before_answers.get(qid, {}).get("answer", "").strip()
-        a = after_answers.get(qid, {}).get("answer", "").strip()
-
-        if b in ("Yes", "No"):
-            cat_deltas[cat]["before_total"] += 1
-            if b == "Yes":
-                cat_deltas[cat]["before_yes"] += 1
-        if a in ("Yes", "No"):
-            cat_deltas[cat]["after_total"] += 1
-            if a == "Yes":
-                cat_deltas[cat]["after_yes"] += 1
-
-    lines = []
-    lines.append("# HECVAT Assessment Delta Report")
-    lines.append("")
-    lines.append(f"**Before**: {before.get('assessment_date', '?')} on `{before.get('branch', '?')}`")
-    lines.append(f"**After**: {after.get('assessment_date', '?')} on `{after.get('branch', '?')}`")
-    lines.append("")
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- Improvements (No -> Yes): **{len(improvements)}**")
-    lines.append(f"- Regressions (Yes -> No): **{len(regressions)}**")
-    lines.append(f"- Newly assessed: **{len(newly_assessed)}**")
-    lines.append(f"- Unchanged Yes: {unchanged_yes}")
-    lines.append(f"- Unchanged No: {unchanged_no}")
-    lines.append("")
-
+    # Accumulate the report in a StringIO buffer — one contiguous C-level
+    # buffer instead of a list of line strings joined at the end
+    buf = io.StringIO()
+    w = buf.write
+    w("# HECVAT Assessment Delta Report\n\n")
+    w(f"**Before**: {before.get('assessment_date', '?')} on `{before.get('branch', '?')}`\n")
+    w(f"**After**: {after.get('assessment_date', '?')} on `{after.get('branch', '?')}`\n\n")
+
+    w("## Summary\n\n")
+    w(f"- Improvements (No -> Yes): **{len(improvements)}**\n")
+    w(f"- Regressions (Yes -> No): **{len(regressions)}**\n")
+    w(f"- Newly assessed: **{len(newly_assessed)}**\n")
+    w(f"- Unchanged Yes: {unchanged_yes}\n")
+    w(f"- Unchanged No: {unchanged_no}\n\n")
+
+    # Table bodies are emitted as one join over a generator per table — a
+    # single C-level concatenation instead of a write call per row
     if improvements:
-        lines.append("## Improvements (No -> Yes)")
-        lines.append("")
-        lines.append("| Question | Category | Detail |")
-        lines.append("|----------|----------|--------|")
-        for qid in improvements:
-            cat = qid.rsplit("-", 1)[0]
-            detail = after_answers.get(qid, {}).get("additional_info", "")[:80]
-            lines.append(f"| {qid} | {cat} | {detail} |")
-        lines.append("")
+        w("## Improvements (No -> Yes)\n\n")
+        w("| Question | Category | Detail |\n")
+        w("|----------|----------|--------|\n")
+        w("".join(
+            f"| {qid} | {qid_to_cat[qid]} | {after_get(qid, {}).get('additional_info', '')[:80]} |\n"
+            for qid in improvements))
+        w("\n")
 
     if regressions:
-        lines.append("## Regressions (Yes -> No)")
-        lines.append("")
-        lines.append("| Question | Category | Detail |")
-        lines.append("|----------|----------|--------|")
-        for qid in regressions:
-            cat = qid.rsplit("-", 1)[0]
-            detail = after_answers.get(qid, {}).get("additional_info", "")[:80]
-            lines.append(f"| {qid} | {cat} | {detail} |")
-        lines.append("")
+        w("## Regressions (Yes -> No)\n\n")
+        w("| Question | Category | Detail |\n")
+        w("|----------|----------|--------|\n")
+        w("".join(
+            f"| {qid} | {qid_to_cat[qid]} | {after_get(qid, {}).get('additional_info', '')[:80]} |\n"
+            for qid in regressions))
+        w("\n")
 
     if newly_assessed:
-        lines.append("## Newly Assessed")
-        lines.append("")
-        lines.append("| Question | Answer | Category |")
-        lines.append("|----------|--------|----------|")
-        for qid, ans in newly_assessed:
-            cat = qid.rsplit("-", 1)[0]
-            lines.append(f"| {qid} | {ans} | {cat} |")
-        lines.append("")
+        w("## Newly Assessed\n\n")
+        w("| Question | Answer | Category |\n")
+        w("|----------|--------|----------|\n")
+        w("".join(f"| {qid} | {ans} | {qid_to_cat[qid]} |\n"
+                  for qid, ans in newly_assessed))
+        w("\n")
 
     # Category score deltas
     cats_with_change = {cat: d for cat, d in cat_deltas.items()
                         if d["before_total"] > 0 or d["after_total"] > 0}
     if cats_with_change:
-        lines.append("## Category Score Deltas")
-        lines.append("")
-        lines.append("| Category | Before | After | Delta |")
-        lines.append("|----------|--------|-------|-------|")
+        w("## Category Score Deltas\n\n")
+        w("| Category | Before | After | Delta |\n")
+        w("|----------|--------|-------|-------|\n")
         for cat in sorted(cats_with_change.keys()):
             d = cats_with_change[cat]
             b_pct = round(d["before_yes"] / d["before_total"] * 100, 1) if d["before_total"] > 0 else 0
             a_pct = round(d["after_yes"] / d["after_total"] * 100, 1) if d["after_total"] > 0 else 0
             delta = round(a_pct - b_pct, 1)
             if delta != 0:
-                lines.append(f"| {cat} | {d['before_yes']}/{d['before_total']} ({b_pct}%) | {d['after_yes']}/{d['after_total']} ({a_pct}%) | {delta:+.1f}% |")
-        lines.append("")
+                w(f"| {cat} | {d['before_yes']}/{d['before_total']} ({b_pct}%) | {d['after_yes']}/{d['after_total']} ({a_pct}%) | {delta:+.1f}% |\n")
+        w("\n")
+
+    return buf.getvalue()
 
-    output = "\n".join(lines)
+
+def generate_delta(before_path, after_path, weights_path, output_path=None):
+    """Compare two assessments and generate a delta report.
+
+    Returns the rendered markdown so callers can use the report without
+    re-reading the output file.
+    """
+    output = _generate_delta_core(
+        _load_json(before_path), _load_json(after_path),
+        load_weights(weights_path))
     if output_path:
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
         with open(output_path, "w") as f:
@@ -176,6 +236,7 @@ def generate_delta(before_path, after_path, weights_path, output_path=None):
         print(f"Delta report: {output_path}")
     else:
         print(output)
+    return output
 
 
 if __name__ == "__main__":
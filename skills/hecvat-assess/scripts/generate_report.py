@@ -9,42 +9,156 @@ copies the template xlsx, and fills in Answer (col C) and Additional Information
 (col D) for each question across all response sheets.
 """
 
-import json
+import pickle
+import re
 import sys
 import os
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from _jsonio import load as _load_json, loads as _json_loads
 
-def find_question_cells(ws, max_row):
-    """Build a map of question_id -> row_number for a worksheet."""
+# HECVAT question ID shape (PREFIX-NN); one compiled match replaces the
+# split/isalpha/isdigit chain per candidate row
+_QID_RE = re.compile(r"^[A-Za-z]+-\d+$")
+
+# Fixed template layout: answers go in column C, additional info in column D.
+# Integer addressing via ws.cell skips the coordinate-string parse that
+# subscript access ("C12") performs on every write.
+ANSWER_COL = 3
+INFO_COL = 4
+
+# Row of the "Date Completed" label on START HERE, keyed by template
+# identity (path, mtime, size) so the header probe runs once per template
+# instead of once per report
+_DATE_ROW_CACHE = {}
+
+try:
+    # ijson streams just the answers subtree instead of materializing the
+    # whole assessment — the report generator reads nothing else, so for
+    # large assessments the metadata and any future top-level sections never
+    # become Python objects at all
+    import ijson
+
+    def _load_answers_from_path(path):
+        with open(path, 'rb') as f:
+            return dict(ijson.kvitems(f, 'answers'))
+except ImportError:
+    def _load_answers_from_path(path):
+        return _load_json(path).get("answers", {})
+
+
+def _load_answers(source):
+    """Extract the answers map from a path, an open file-like, or a dict.
+
+    In-memory callers hand over the dict and skip JSON entirely; file-like
+    input covers pipes and pre-opened handles; a plain path keeps the CLI
+    behaviour (and the ijson streaming fast path) unchanged.
+    """
+    if isinstance(source, dict):
+        return source.get("answers", {})
+    if hasattr(source, "read"):
+        return _json_loads(source.read()).get("answers", {})
+    return _load_answers_from_path(source)
+
+
+def find_question_cells(ws, max_row=None):
+    """Build a map of question_id -> row_number for a worksheet.
+
+    Iterates column A once with values_only instead of constructing a Cell
+    object per row; max_row defaults to the sheet's own extent.
+    """
     qmap = {}
-    for row_num in range(1, max_row + 1):
-        cell_a = ws.cell(row=row_num, column=1).value
-        if cell_a and isinstance(cell_a, str) and "-" in cell_a:
-            # Check if it looks like a HECVAT question ID (PREFIX-NN)
-            parts = cell_a.strip().split("-")
-            if len(parts) == 2 and parts[0].isalpha() and parts[1].isdigit():
-                qmap[cell_a.strip()] = row_num
+    rows = ws.iter_rows(min_col=1, max_col=1, max_row=max_row, values_only=True)
+    for row_num, (cell_a,) in enumerate(rows, start=1):
+        if isinstance(cell_a, str):
+            s = cell_a.strip()
+            if _QID_RE.match(s):
+                qmap[s] = row_num
     return qmap
 
 
-def generate_report(template_path: str, assessment_path: str, output_path: str):
+def find_all_question_cells(wb):
+    """Map every sheet's question ids in one pass: {sheet_name: {qid: row}}.
+
+    One call replaces per-sheet find_question_cells loops at call sites;
+    the compiled id regex and iterator machinery are shared across sheets.
+    """
+    return {name: find_question_cells(wb[name]) for name in wb.sheetnames}
+
+
+def _build_qmap(template_path, sheet_name):
+    """Build one sheet's qmap from a private read_only workbook handle.
+
+    Each worker opens its own handle because the shared zipfile underlying a
+    workbook is not safe for concurrent reads across threads.
+    """
+    import openpyxl
+
+    wb_ro = openpyxl.load_workbook(template_path, read_only=True)
+    try:
+        return sheet_name, find_question_cells(wb_ro[sheet_name])
+    finally:
+        wb_ro.close()
+
+
+def _load_qmaps(template_path, sheet_names):
+    """Per-sheet question maps for a template, cached on disk.
+
+    A <template>.qmap.pkl sidecar (same pattern as the weights caches)
+    stores the scanned maps together with the template's mtime and size;
+    warm runs — including separate processes — skip the sheet scans
+    entirely. Best-effort on both ends: a missing, stale, or unreadable
+    sidecar just means one fresh scan, and an unwritable directory means
+    no sidecar next time.
+    """
+    st = os.stat(template_path)
+    stamp = (st.st_mtime, st.st_size)
+    cache_path = template_path + ".qmap.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp and \
+                all(s in cached["qmaps"] for s in sheet_names):
+            return cached["qmaps"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        pass
+
+    # Build the per-sheet qmaps concurrently over private read_only handles
+    # (the C-level XML parsing overlaps across threads)
+    with ThreadPoolExecutor(max_workers=min(8, len(sheet_names))) as pool:
+        qmaps = dict(pool.map(
+            lambda name: _build_qmap(template_path, name), sheet_names))
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump({"stamp": stamp, "qmaps": qmaps}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return qmaps
+
+
+def generate_report(template_path: str, assessment_source, output_path: str,
+                    qmap: dict = None):
+    """Fill the HECVAT template with assessment answers and save it.
+
+    assessment_source may be a JSON file path, an open file-like, or an
+    already-loaded assessment dict. qmap optionally supplies a precomputed
+    {sheet_name: {question_id: row}} map (e.g. built once per immutable
+    template by a caller filling many reports); when given, the per-sheet
+    template scans are skipped.
+
+    Returns the in-memory workbook that was saved.
+    """
     try:
         import openpyxl
     except ImportError:
         print("ERROR: openpyxl required. Install with: pip install openpyxl", file=sys.stderr)
         sys.exit(1)
 
-    # Load assessment results
-    with open(assessment_path) as f:
-        assessment = json.load(f)
-
     # answers is a dict: question_id -> {answer, evidence, additional_info}
-    answers = assessment.get("answers", {})
-
-    # Load template (preserve formatting)
-    wb = openpyxl.load_workbook(template_path)
+    answers = _load_answers(assessment_source)
 
     # Response sheets where answers go
     response_sheets = [
@@ -52,51 +166,88 @@ def generate_report(template_path: str, assessment_path: str, output_path: str):
         "IT Accessibility", "Case-Specific", "AI", "Privacy"
     ]
 
+    # Load template (preserve formatting)
+    wb = openpyxl.load_workbook(template_path)
+
+    # Phase 1: resolve the per-sheet qmaps (sidecar cache or fresh scan);
+    # phase 2 applies the cell writes serially, since workbook writes are
+    # not thread-safe
+    present_sheets = [s for s in response_sheets if s in wb.sheetnames]
+    qmaps = {}
+    if qmap is not None:
+        qmaps = qmap
+    elif present_sheets and answers:
+        # With no answers to place there is nothing to look up, so the
+        # sheet scans are skipped (the Date Completed stamp below does not
+        # need them)
+        qmaps = _load_qmaps(template_path, present_sheets)
+
+    # Prepare the cell contents once per answer. A question can appear on
+    # several response sheets, so hoisting the string assembly out of the
+    # sheet loop avoids rebuilding full_info per occurrence.
+    prepared = {}
+    for qid, ans in answers.items():
+        # Column D = Additional Information (evidence + notes)
+        additional = ans.get("additional_info", "")
+        evidence = ans.get("evidence", "")
+        if evidence and additional:
+            full_info = f"{additional}\n\nEvidence: {evidence}"
+        elif evidence:
+            full_info = f"Evidence: {evidence}"
+        else:
+            full_info = additional
+        prepared[qid] = (ans.get("answer", ""), full_info)
+
     filled_count = 0
-    for sheet_name in response_sheets:
-        if sheet_name not in wb.sheetnames:
+    for sheet_name in present_sheets:
+        qmap = qmaps.get(sheet_name)
+        if not qmap:
             continue
         ws = wb[sheet_name]
-        qmap = find_question_cells(ws, ws.max_row)
-
-        for qid, row_num in qmap.items():
-            if qid in answers:
-                ans = answers[qid]
-                # Column C = Answer
-                answer_val = ans.get("answer", "")
-                if answer_val:
-                    ws.cell(row=row_num, column=3, value=answer_val)
-
-                # Column D = Additional Information (evidence + notes)
-                additional = ans.get("additional_info", "")
-                evidence = ans.get("evidence", "")
-                if evidence and additional:
-                    full_info = f"{additional}\n\nEvidence: {evidence}"
-                elif evidence:
-                    full_info = f"Evidence: {evidence}"
-                elif additional:
-                    full_info = additional
-                else:
-                    full_info = ""
-
-                if full_info:
-                    ws.cell(row=row_num, column=4, value=full_info)
-
-                filled_count += 1
+
+        # Intersect in C instead of probing answers per qmap entry; only the
+        # ids actually present on this sheet are visited
+        for qid in prepared.keys() & qmap.keys():
+            row_num = qmap[qid]
+            answer_val, full_info = prepared[qid]
+            if answer_val:
+                ws.cell(row=row_num, column=ANSWER_COL, value=answer_val)
+            if full_info:
+                ws.cell(row=row_num, column=INFO_COL, value=full_info)
+
+            filled_count += 1
 
     # Update the date completed on START HERE
     if "START HERE" in wb.sheetnames:
         ws = wb["START HERE"]
-        # Row 3 typically has "Date Completed" in col A, value in col C
-        for row_num in range(1, 10):
-            if ws.cell(row=row_num, column=1).value and "Date Completed" in str(ws.cell(row=row_num, column=1).value):
-                ws.cell(row=row_num, column=3, value=datetime.now().strftime("%Y-%m-%d"))
-                break
+        today = datetime.now().strftime("%Y-%m-%d")
+        try:
+            st = os.stat(template_path)
+            cache_key = (template_path, st.st_mtime, st.st_size)
+        except OSError:
+            cache_key = None
+        date_row = _DATE_ROW_CACHE.get(cache_key)
+        if date_row is None:
+            # Row 3 typically has "Date Completed" in col A, value in col C;
+            # stream the first few col-A values instead of per-cell lookups
+            rows = ws.iter_rows(min_row=1, max_row=9, min_col=1, max_col=1,
+                                values_only=True)
+            for row_num, (val,) in enumerate(rows, start=1):
+                if val and "Date Completed" in str(val):
+                    date_row = row_num
+                    break
+            if cache_key is not None and date_row is not None:
+                _DATE_ROW_CACHE[cache_key] = date_row
+        if date_row is not None:
+            ws.cell(row=date_row, column=ANSWER_COL, value=today)
 
     # Save
     wb.save(output_path)
     print(f"Report generated: {output_path}")
     print(f"Filled {filled_count} question cells across {len(response_sheets)} sheets")
+    # Hand the in-memory workbook back so callers can inspect the result
+    # without re-parsing the file they just wrote
+    return wb
 
 
 if __name__ == "__main__":
@@ -9,97 +9,223 @@ If output_md is not provided, prints to stdout.
 If --compare is provided, includes a delta table showing what changed between assessments.
 """
 
-import json
+import heapq
+import io
+import re
 import sys
 import os
 from collections import defaultdict
 from datetime import datetime
 
+from _jsonio import load as _load_json
+from _jsonio import dump as _dump_json
 
-def load_weights(weights_path: str) -> dict:
-    """Load category weights from scoring-weights.yaml."""
+
+def load_weights_and_names(weights_path: str) -> tuple:
+    """Load category weights and full names from scoring-weights.yaml.
+
+    Both come from the same category_weights mapping, so one parse of the
+    file yields both dicts; returns (weights, names).
+
+    A JSON sidecar cache (<weights_path>.json) is written after a parse and
+    reused on later runs while it is at least as new as the YAML, so repeated
+    CLI invocations skip YAML parsing entirely.
+    """
+    cache_path = weights_path + '.json'
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(weights_path):
+            cached = _load_json(cache_path)
+            return cached['weights'], cached['names']
+    except (OSError, ValueError, KeyError):
+        pass  # Missing, stale, or corrupt cache — fall through to the parse
+
+    weights, names = _parse_weights_and_names(weights_path)
+    try:
+        _dump_json({'weights': weights, 'names': names}, cache_path)
+    except OSError:
+        pass  # Read-only location; caching is best-effort
+    return weights, names
+
+
+def _parse_weights_and_names(weights_path: str) -> tuple:
     try:
         import yaml
     except ImportError:
-        # Fallback: parse the simple YAML structure manually
+        # Fallback: extract category weight/name pairs with a single regex
+        # pass over the file
         weights = {}
+        names = {}
         with open(weights_path) as f:
-            current_cat = None
-            for line in f:
-                line = line.strip()
-                if line.endswith(':') and not line.startswith('#') and not line.startswith('-'):
-                    key = line[:-1].strip()
-                    if key.isupper() and 2 <= len(key) <= 4:
-                        current_cat = key
-                elif current_cat and line.startswith('weight:'):
-                    weights[current_cat] = int(line.split(':')[1].strip())
-                    current_cat = None
-                elif line == '' or line.startswith('#'):
-                    if not (current_cat and line == ''):
-                        current_cat = None
-        return weights
-
+            text = f.read()
+        current_cat = None
+        for m in _WEIGHTS_RE.finditer(text):
+            cat = m.group('cat')
+            if cat:
+                current_cat = cat
+            elif current_cat and m.group('w'):
+                weights[current_cat] = int(m.group('w'))
+            elif current_cat and m.group('n'):
+                names[current_cat] = m.group('n').strip('"').strip("'")
+        return weights, names
+
+    # Prefer the libyaml-backed C loader when available — same output as
+    # safe_load but without the pure-Python scanner/parser overhead
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(weights_path) as f:
-        data = yaml.safe_load(f)
-    return {
-        cat: info['weight']
-        for cat, info in data.get('category_weights', {}).items()
-    }
+        data = yaml.load(f, Loader=loader)
+    category_weights = data.get('category_weights', {})
+    weights = {cat: info['weight'] for cat, info in category_weights.items()}
+    names = {cat: info['name'] for cat, info in category_weights.items()}
+    return weights, names
+
+
+def load_weights(weights_path: str) -> dict:
+    """Load category weights from scoring-weights.yaml."""
+    return load_weights_and_names(weights_path)[0]
 
 
 def load_category_names(weights_path: str) -> dict:
     """Load category full names from scoring-weights.yaml."""
-    try:
-        import yaml
-        with open(weights_path) as f:
-            data = yaml.safe_load(f)
-        return {
-            cat: info['name']
-            for cat, info in data.get('category_weights', {}).items()
-        }
-    except ImportError:
-        # Fallback
-        names = {}
-        with open(weights_path) as f:
-            current_cat = None
-            for line in f:
-                line = line.strip()
-                if line.endswith(':') and not line.startswith('#') and not line.startswith('-'):
-                    key = line[:-1].strip()
-                    if key.isupper() and 2 <= len(key) <= 4:
-                        current_cat = key
-                elif current_cat and line.startswith('name:'):
-                    name = line.split(':', 1)[1].strip().strip('"').strip("'")
-                    names[current_cat] = name
-                    current_cat = None
-        return names
+    return load_weights_and_names(weights_path)[1]
+
+
+# Answer -> tally-bucket dispatch table; anything unrecognized counts as blank
+_BUCKET = {"Yes": "yes", "No": "no", "N/A": "na", "NA": "na"}
+
+# Fallback weights parser: one multiline regex over the whole file replaces
+# the per-line strip/startswith/endswith dispatch. Matches indented category
+# headers like "  AAAI:" with their "weight:" and "name:" entries.
+_WEIGHTS_RE = re.compile(
+    r"^\s*(?P<cat>[A-Z]{2,4}):\s*$"
+    r"|^\s*weight:\s*(?P<w>\d+)\s*$"
+    r"|^\s*name:\s*(?P<n>.+?)\s*$", re.M)
+
+# Fix-type labels for the gaps table
+_TYPE_DESCRIPTIONS = {
+    "code": "Patchable code change (auto-generated in .patch file)",
+    "config": "Configuration file change (auto-generated in .patch file)",
+    "new_file": "New file to create (auto-generated in .patch file)",
+    "documentation": "Documentation to add/update in the repo",
+    "policy": "Organizational policy or process needed",
+    "organizational": "Requires business/legal attestation",
+    "unknown": "Not yet classified",
+}
+
+# Static glossary section appended to every summary
+_GLOSSARY = """\
+## Glossary
+
+| Term | Meaning |
+|------|---------|
+| HECVAT | Higher Education Community Vendor Assessment Toolkit (by EDUCAUSE) |
+| EDUCAUSE | Nonprofit association for higher education IT professionals |
+| Weighted score | Score adjusted by category importance (auth matters more than docs) |
+| Raw score | Simple ratio: compliant questions / total assessed questions |
+| N/A | Question does not apply to this product/service |
+| Org attestation | Question requires organizational (not code) answer |
+| Patchable | Gap that can be fixed by applying the auto-generated .patch file |
+| AAAI | Authentication, Authorization, and Accounting / Identity |
+| APPL | Application Security (input validation, XSS, injection, headers) |
+| DATA | Data Security (encryption, key management, backups, retention) |
+| VULN | Vulnerability Management (scanning, patching, dependency audits) |
+| CHNG | Change Management (CI/CD, code review, release process) |
+| ITAC | IT Accessibility (WCAG compliance, screen readers, keyboard nav) |
+| AISC | AI Security Controls (prompt injection, model poisoning defenses) |
+| AILM | AI Language Models (LLM-specific risks: hallucination, leakage) |
+| AIGN | AI Governance (risk assessment, responsible AI, oversight) |
+| DPAI | Data Privacy — AI (AI-specific data handling and consent) |
+| DCTR | Data Center (cloud/hosting infrastructure security) |
+| OPEM | Operational Management (monitoring, alerting, incident response) |
+| DRPV | Disaster Recovery / Privacy (backups, DPIA, privacy notices) |
+| PDAT | Privacy Data (data residency, demographics, cross-border) |
+| WAF | Web Application Firewall — filters malicious HTTP traffic |
+| RBAC | Role-Based Access Control — permissions tied to user roles |
+| SSO | Single Sign-On — one login for multiple systems |
+| OIDC | OpenID Connect — modern authentication protocol built on OAuth2 |
+| SAML | Security Assertion Markup Language — enterprise SSO protocol |
+| MFA | Multi-Factor Authentication — requires 2+ verification methods |
+| CSP | Content Security Policy — browser header preventing XSS attacks |
+| HSTS | HTTP Strict Transport Security — forces HTTPS connections |
+| SAST | Static Application Security Testing — code scanning for vulns |
+| DAST | Dynamic Application Security Testing — runtime vulnerability scanning |
+| WCAG | Web Content Accessibility Guidelines (target: 2.1 AA) |
+| VPAT | Voluntary Product Accessibility Template — accessibility report |
+| DPIA | Data Privacy Impact Assessment — formal privacy risk analysis |
+| NIST AI RMF | NIST AI Risk Management Framework — AI governance standard |
+| SOC 2 | Service Organization Control 2 — security audit certification |
+
+"""
 
 
-def analyze_assessment(assessment: dict) -> dict:
-    """Analyze an assessment JSON and produce summary statistics."""
+def _category_row(cat: str, wt: int, name: str, s: dict) -> str:
+    """Format one category-breakdown table row (assessed count is nonzero)."""
+    assessed = s["yes"] + s["no"]
+    pct = round(s["yes"] / assessed * 100, 1)
+    wtd = round(pct / 100 * wt, 2)
+    # Show up to 3 gap IDs
+    gap_preview = ", ".join(s["gaps"][:3])
+    if len(s["gaps"]) > 3:
+        gap_preview += f" (+{len(s['gaps']) - 3} more)"
+    return (f"| {cat} | {name} | {wt} | {s['yes']} | {s['no']} | {s['na']} "
+            f"| {pct}% | {wtd} | {gap_preview} |\n")
+
+
+def analyze_and_score(assessment: dict, weights: dict) -> tuple:
+    """Analyze an assessment and score it in a single pass over the answers.
+
+    One iteration of the answers dict yields the per-category tallies, the
+    raw/weighted scores, and the confidence-adjusted score, instead of three
+    separate scans. Returns (category_stats, scores, conf_score).
+    """
     answers = assessment.get("answers", {})
+    quality_map = {"Strong": 1.0, "Moderate": 0.75, "Weak": 0.5, "Inferred": 0.25}
 
-    # Per-category tallies
-    categories = defaultdict(lambda: {"yes": 0, "no": 0, "na": 0, "blank": 0, "gaps": [], "fix_types": defaultdict(int)})
+    # Per-category tallies plus confidence accumulators, filled together
+    categories = {}
+    has_quality = False
+    total_quality = 0.0
+    assessed_count = 0
 
     for qid, ans in answers.items():
         # Extract category prefix (e.g., "AAAI" from "AAAI-01")
-        cat = qid.rsplit("-", 1)[0] if "-" in qid else qid
+        cat = qid.rpartition("-")[0] or qid
+
+        stats = categories.get(cat)
+        if stats is None:
+            stats = categories[cat] = {"yes": 0, "no": 0, "na": 0, "blank": 0,
+                                       "gaps": [], "fix_types": {}}
 
         answer = ans.get("answer", "").strip()
-        if answer == "Yes":
-            categories[cat]["yes"] += 1
-        elif answer == "No":
-            categories[cat]["no"] += 1
-            categories[cat]["gaps"].append(qid)
+        bucket = _BUCKET.get(answer, "blank")
+        stats[bucket] += 1
+        if bucket == "no":
+            stats["gaps"].append(qid)
             fix_type = ans.get("fix_type", "unknown")
-            categories[cat]["fix_types"][fix_type] += 1
-        elif answer in ("N/A", "NA"):
-            categories[cat]["na"] += 1
-        else:
-            categories[cat]["blank"] += 1
+            stats["fix_types"][fix_type] = stats["fix_types"].get(fix_type, 0) + 1
+
+        if bucket in ("yes", "no"):
+            assessed_count += 1
+            eq = ans.get("evidence_quality")
+            if eq:
+                has_quality = True
+                if bucket == "yes":
+                    total_quality += quality_map.get(eq, 0.5)
+            elif bucket == "yes":
+                total_quality += 1.0  # Default to full credit if no evidence_quality
+
+    scores = compute_scores(categories, weights)
+
+    if not has_quality or assessed_count == 0:
+        conf_score = -1  # Sentinel: no evidence_quality data available
+    else:
+        conf_score = round(total_quality / assessed_count * 100, 1)
+
+    return categories, scores, conf_score
+
 
-    return dict(categories)
+def analyze_assessment(assessment: dict) -> dict:
+    """Analyze an assessment JSON and produce summary statistics."""
+    return analyze_and_score(assessment, {})[0]
 
 
 def compute_scores(category_stats: dict, weights: dict) -> dict:
@@ -137,121 +263,73 @@ def compute_scores(category_stats: dict, weights: dict) -> dict:
 
 def compute_confidence_adjusted_score(assessment: dict, weights: dict) -> float:
     """Compute confidence-adjusted score using evidence_quality fields."""
-    answers = assessment.get("answers", {})
-    quality_map = {"Strong": 1.0, "Moderate": 0.75, "Weak": 0.5, "Inferred": 0.25}
-
-    has_quality = False
-    total_quality = 0.0
-    assessed_count = 0
-
-    for qid, ans in answers.items():
-        answer = ans.get("answer", "").strip()
-        if answer not in ("Yes", "No"):
-            continue
-        assessed_count += 1
-        eq = ans.get("evidence_quality")
-        if eq:
-            has_quality = True
-            if answer == "Yes":
-                total_quality += quality_map.get(eq, 0.5)
-        elif answer == "Yes":
-            total_quality += 1.0  # Default to full credit if no evidence_quality
-
-    if not has_quality or assessed_count == 0:
-        return -1  # Sentinel: no evidence_quality data available
+    return analyze_and_score(assessment, weights)[2]
 
-    return round(total_quality / assessed_count * 100, 1)
 
+def _render_summary(assessment: dict, weights: dict, names: dict,
+                    compare: dict = None) -> str:
+    """Render the summary markdown for an already-loaded assessment dict.
 
-def generate_summary(
-    assessment_path: str,
-    weights_path: str,
-    output_path: str = None,
-    compare_path: str = None
-):
-    """Generate the full summary report."""
-    with open(assessment_path) as f:
-        assessment = json.load(f)
-
-    weights = load_weights(weights_path)
-    names = load_category_names(weights_path)
-    stats = analyze_assessment(assessment)
-    scores = compute_scores(stats, weights)
-
-    # Confidence-adjusted score
-    conf_score = compute_confidence_adjusted_score(assessment, weights)
+    Pure compute — no file I/O — so in-memory callers (and the tests) can
+    render summaries without the JSON write/read round-trip that the
+    path-based wrapper below exists for.
+    """
+    stats, scores, conf_score = analyze_and_score(assessment, weights)
 
     # Comparison data if provided
-    compare_stats = None
     compare_scores = None
-    if compare_path:
-        with open(compare_path) as f:
-            compare_assessment = json.load(f)
-        compare_stats = analyze_assessment(compare_assessment)
-        compare_scores = compute_scores(compare_stats, weights)
-
-    lines = []
-    lines.append("# HECVAT Assessment Summary")
-    lines.append("")
-    lines.append(f"**Repository**: {assessment.get('repository', 'unknown')}")
-    lines.append(f"**Date**: {assessment.get('assessment_date', 'unknown')} | **HECVAT**: v{assessment.get('hecvat_version', '4.1.4')} | **Branch**: {assessment.get('branch', 'unknown')}")
-    lines.append("")
+    if compare is not None:
+        _, compare_scores, _ = analyze_and_score(compare, weights)
+
+    # Accumulate the report in a StringIO buffer — one contiguous C-level
+    # buffer instead of a list of line strings joined at the end
+    buf = io.StringIO()
+    w = buf.write
+    w("# HECVAT Assessment Summary\n\n")
+    w(f"**Repository**: {assessment.get('repository', 'unknown')}\n")
+    w(f"**Date**: {assessment.get('assessment_date', 'unknown')} | **HECVAT**: v{assessment.get('hecvat_version', '4.1.4')} | **Branch**: {assessment.get('branch', 'unknown')}\n\n")
 
     # Overall scores
-    lines.append("## Overall Scores")
-    lines.append("")
-    lines.append("| Metric | Score |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Raw compliance | {scores['raw_yes']}/{scores['raw_assessed']} ({scores['raw_pct']}%) |")
-    lines.append(f"| Weighted score | {scores['weighted_score']} / 100 |")
+    w("## Overall Scores\n\n")
+    w("| Metric | Score |\n")
+    w("|--------|-------|\n")
+    w(f"| Raw compliance | {scores['raw_yes']}/{scores['raw_assessed']} ({scores['raw_pct']}%) |\n")
+    w(f"| Weighted score | {scores['weighted_score']} / 100 |\n")
 
     # Count org attestation
     org_count = sum(s["blank"] for s in stats.values())
-    lines.append(f"| Org attestation (not code-assessable) | {org_count} questions |")
+    w(f"| Org attestation (not code-assessable) | {org_count} questions |\n")
 
     if conf_score >= 0:
-        lines.append(f"| Confidence-adjusted score | {conf_score} / 100 (conservative — weights by evidence strength) |")
+        w(f"| Confidence-adjusted score | {conf_score} / 100 (conservative — weights by evidence strength) |\n")
 
-    lines.append("")
+    w("\n")
 
     if compare_scores:
-        lines.append("### Comparison")
-        lines.append("")
-        lines.append("| Metric | Before | After | Delta |")
-        lines.append("|--------|--------|-------|-------|")
-        lines.append(f"| Raw | {compare_scores['raw_yes']}/{compare_scores['raw_assessed']} ({compare_scores['raw_pct']}%) | {scores['raw_yes']}/{scores['raw_assessed']} ({scores['raw_pct']}%) | {scores['raw_pct'] - compare_scores['raw_pct']:+.1f}% |")
-        lines.append(f"| Weighted | {compare_scores['weighted_score']} | {scores['weighted_score']} | {scores['weighted_score'] - compare_scores['weighted_score']:+.1f} |")
-        lines.append("")
+        w("### Comparison\n\n")
+        w("| Metric | Before | After | Delta |\n")
+        w("|--------|--------|-------|-------|\n")
+        w(f"| Raw | {compare_scores['raw_yes']}/{compare_scores['raw_assessed']} ({compare_scores['raw_pct']}%) | {scores['raw_yes']}/{scores['raw_assessed']} ({scores['raw_pct']}%) | {scores['raw_pct'] - compare_scores['raw_pct']:+.1f}% |\n")
+        w(f"| Weighted | {compare_scores['weighted_score']} | {scores['weighted_score']} | {scores['weighted_score'] - compare_scores['weighted_score']:+.1f} |\n\n")
 
     # Category breakdown
-    lines.append("## Category Breakdown")
-    lines.append("")
-    lines.append("| Category | Full Name | Wt | Yes | No | N/A | Score | Wtd | Top Gaps |")
-    lines.append("|----------|-----------|-----|-----|-----|-----|-------|-----|----------|")
-
-    # Sort by weight descending, then alphabetical
-    sorted_cats = sorted(
-        stats.items(),
-        key=lambda x: (-weights.get(x[0], 0), x[0])
+    w("## Category Breakdown\n\n")
+    w("| Category | Full Name | Wt | Yes | No | N/A | Score | Wtd | Top Gaps |\n")
+    w("|----------|-----------|-----|-----|-----|-----|-------|-----|----------|\n")
+
+    # Filter to weighted, assessed categories once (skipping
+    # org-attestation-only categories), decorating each row with its weight
+    # so the sort and the formatter don't re-run the lookups; sorted by
+    # weight descending, then alphabetical
+    rows = sorted(
+        ((weights[cat], cat, s) for cat, s in stats.items()
+         if weights.get(cat, 0) and (s["yes"] + s["no"]) > 0),
+        key=lambda r: (-r[0], r[1])
     )
+    w("".join(_category_row(cat, wt, names.get(cat, cat), s)
+              for wt, cat, s in rows))
 
-    for cat, s in sorted_cats:
-        w = weights.get(cat, 0)
-        if w == 0:
-            continue  # Skip org-attestation-only categories
-        assessed = s["yes"] + s["no"]
-        if assessed == 0:
-            continue
-        pct = round(s["yes"] / assessed * 100, 1) if assessed > 0 else 0
-        wtd = round(pct / 100 * w, 2)
-        full_name = names.get(cat, cat)
-        # Show up to 3 gap IDs
-        gap_preview = ", ".join(s["gaps"][:3])
-        if len(s["gaps"]) > 3:
-            gap_preview += f" (+{len(s['gaps']) - 3} more)"
-        lines.append(f"| {cat} | {full_name} | {w} | {s['yes']} | {s['no']} | {s['na']} | {pct}% | {wtd} | {gap_preview} |")
-
-    lines.append("")
+    w("\n")
 
     # Fix type breakdown
     all_fix_types = defaultdict(int)
@@ -260,94 +338,55 @@ def generate_summary(
             all_fix_types[ft] += count
 
     if all_fix_types:
-        lines.append("## Gaps by Fix Type")
-        lines.append("")
-        lines.append("| Type | Count | Description |")
-        lines.append("|------|-------|-------------|")
-        type_descriptions = {
-            "code": "Patchable code change (auto-generated in .patch file)",
-            "config": "Configuration file change (auto-generated in .patch file)",
-            "new_file": "New file to create (auto-generated in .patch file)",
-            "documentation": "Documentation to add/update in the repo",
-            "policy": "Organizational policy or process needed",
-            "organizational": "Requires business/legal attestation",
-            "unknown": "Not yet classified",
-        }
-        for ft in ["code", "config", "new_file", "documentation", "policy", "organizational", "unknown"]:
+        w("## Gaps by Fix Type\n\n")
+        w("| Type | Count | Description |\n")
+        w("|------|-------|-------------|\n")
+        for ft in _TYPE_DESCRIPTIONS:
             if ft in all_fix_types:
-                lines.append(f"| {ft} | {all_fix_types[ft]} | {type_descriptions.get(ft, '')} |")
+                w(f"| {ft} | {all_fix_types[ft]} | {_TYPE_DESCRIPTIONS[ft]} |\n")
         patchable = all_fix_types.get("code", 0) + all_fix_types.get("config", 0) + all_fix_types.get("new_file", 0)
-        lines.append(f"| **Total patchable** | **{patchable}** | **Can be applied via `git apply`** |")
-        lines.append("")
+        w(f"| **Total patchable** | **{patchable}** | **Can be applied via `git apply`** |\n\n")
 
     # Top remediation priorities
-    lines.append("## Top Remediation Priorities")
-    lines.append("")
-    lines.append("Ranked by gap impact: `weight * (gaps / assessed)` — higher means more impactful to fix.")
-    lines.append("")
+    w("## Top Remediation Priorities\n\n")
+    w("Ranked by gap impact: `weight * (gaps / assessed)` — higher means more impactful to fix.\n\n")
 
-    priorities = []
-    for cat, s in stats.items():
-        w = weights.get(cat, 0)
-        assessed = s["yes"] + s["no"]
-        if w > 0 and s["no"] > 0 and assessed > 0:
-            impact = round(w * (s["no"] / assessed), 2)
-            full_name = names.get(cat, cat)
-            priorities.append((impact, cat, full_name, s["no"], assessed))
-
-    priorities.sort(reverse=True)
-    for i, (impact, cat, full_name, gaps, assessed) in enumerate(priorities[:10], 1):
-        lines.append(f"{i}. **{cat}** ({full_name}) — {gaps} gaps / {assessed} assessed, impact: {impact}")
-    lines.append("")
-
-    # Glossary
-    lines.append("## Glossary")
-    lines.append("")
-    lines.append("| Term | Meaning |")
-    lines.append("|------|---------|")
-    lines.append("| HECVAT | Higher Education Community Vendor Assessment Toolkit (by EDUCAUSE) |")
-    lines.append("| EDUCAUSE | Nonprofit association for higher education IT professionals |")
-    lines.append("| Weighted score | Score adjusted by category importance (auth matters more than docs) |")
-    lines.append("| Raw score | Simple ratio: compliant questions / total assessed questions |")
-    lines.append("| N/A | Question does not apply to this product/service |")
-    lines.append("| Org attestation | Question requires organizational (not code) answer |")
-    lines.append("| Patchable | Gap that can be fixed by applying the auto-generated .patch file |")
-    lines.append("| AAAI | Authentication, Authorization, and Accounting / Identity |")
-    lines.append("| APPL | Application Security (input validation, XSS, injection, headers) |")
-    lines.append("| DATA | Data Security (encryption, key management, backups, retention) |")
-    lines.append("| VULN | Vulnerability Management (scanning, patching, dependency audits) |")
-    lines.append("| CHNG | Change Management (CI/CD, code review, release process) |")
-    lines.append("| ITAC | IT Accessibility (WCAG compliance, screen readers, keyboard nav) |")
-    lines.append("| AISC | AI Security Controls (prompt injection, model poisoning defenses) |")
-    lines.append("| AILM | AI Language Models (LLM-specific risks: hallucination, leakage) |")
-    lines.append("| AIGN | AI Governance (risk assessment, responsible AI, oversight) |")
-    lines.append("| DPAI | Data Privacy — AI (AI-specific data handling and consent) |")
-    lines.append("| DCTR | Data Center (cloud/hosting infrastructure security) |")
-    lines.append("| OPEM | Operational Management (monitoring, alerting, incident response) |")
-    lines.append("| DRPV | Disaster Recovery / Privacy (backups, DPIA, privacy notices) |")
-    lines.append("| PDAT | Privacy Data (data residency, demographics, cross-border) |")
-    lines.append("| WAF | Web Application Firewall — filters malicious HTTP traffic |")
-    lines.append("| RBAC | Role-Based Access Control — permissions tied to user roles |")
-    lines.append("| SSO | Single Sign-On — one login for multiple systems |")
-    lines.append("| OIDC | OpenID Connect — modern authentication protocol built on OAuth2 |")
-    lines.append("| SAML | Security Assertion Markup Language — enterprise SSO protocol |")
-    lines.append("| MFA | Multi-Factor Authentication — requires 2+ verification methods |")
-    lines.append("| CSP | Content Security Policy — browser header preventing XSS attacks |")
-    lines.append("| HSTS | HTTP Strict Transport Security — forces HTTPS connections |")
-    lines.append("| SAST | Static Application Security Testing — code scanning for vulns |")
-    lines.append("| DAST | Dynamic Application Security Testing — runtime vulnerability scanning |")
-    lines.append("| WCAG | Web Content Accessibility Guidelines (target: 2.1 AA) |")
-    lines.append("| VPAT | Voluntary Product Accessibility Template — accessibility report |")
-    lines.append("| DPIA | Data Privacy Impact Assessment — formal privacy risk analysis |")
-    lines.append("| NIST AI RMF | NIST AI Risk Management Framework — AI governance standard |")
-    lines.append("| SOC 2 | Service Organization Control 2 — security audit certification |")
-    lines.append("")
-
-    lines.append("---")
-    lines.append(f"*Generated by HECVAT Assessment Skill on {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-    lines.append("")
-
-    output = "\n".join(lines)
+    # Partial sort: only the top 10 are reported, so nlargest over a
+    # generator avoids materializing and fully sorting the priority list
+    def gap_impacts():
+        for cat, s in stats.items():
+            wt = weights.get(cat, 0)
+            assessed = s["yes"] + s["no"]
+            if wt > 0 and s["no"] > 0 and assessed > 0:
+                impact = round(wt * (s["no"] / assessed), 2)
+                yield (impact, cat, names.get(cat, cat), s["no"], assessed)
+
+    priorities = heapq.nlargest(10, gap_impacts())
+    for i, (impact, cat, full_name, gaps, assessed) in enumerate(priorities, 1):
+        w(f"{i}. **{cat}** ({full_name}) — {gaps} gaps / {assessed} assessed, impact: {impact}\n")
+    w("\n")
+
+    # Glossary (static — emitted as one literal write)
+    w(_GLOSSARY)
+
+    w("---\n")
+    w(f"*Generated by HECVAT Assessment Skill on {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+
+    return buf.getvalue()
+
+
+def generate_summary(
+    assessment_path: str,
+    weights_path: str,
+    output_path: str = None,
+    compare_path: str = None
+):
+    """Generate the full summary report."""
+    assessment = _load_json(assessment_path)
+    weights, names = load_weights_and_names(weights_path)
+    compare = _load_json(compare_path) if compare_path else None
+
+    output = _render_summary(assessment, weights, names, compare)
 
     if output_path:
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
@@ -357,7 +396,10 @@ def generate_summary(
     else:
         print(output)
 
-    # Also print score summary to stdout regardless
+    # Also print score summary to stdout regardless. Re-deriving the scores
+    # here keeps the renderer pure; the extra pass is a single dict walk,
+    # negligible next to the JSON load and render above.
+    scores = analyze_and_score(assessment, weights)[1]
     print(f"\nScore: {scores['raw_yes']}/{scores['raw_assessed']} ({scores['raw_pct']}%) raw, {scores['weighted_score']}/100 weighted")
 
 
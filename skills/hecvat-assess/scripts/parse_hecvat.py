@@ -10,11 +10,64 @@ default_weight, sheet_presence (which sheets the question appears on),
 score_mapping, guidance fields, and repo_assessable flag.
 """
 
-import json
+import re
 import sys
 import os
 from datetime import datetime
 
+from _jsonio import dump as _dump_json
+
+# HECVAT question ID shape (PREFIX-NN); one compiled match validates a
+# candidate row id and captures its category prefix
+_QID_RE = re.compile(r"^([A-Za-z]+)-\d+$")
+
+# Repo-assessable question prefixes/patterns
+# These categories contain questions that can typically be answered from code.
+# Module-level frozensets: built once at import and hashed membership is O(1).
+_REPO_ASSESSABLE_PREFIXES = frozenset({
+    "AAAI",  # Authentication, Authorization, Account Management
+    "APPL",  # Application/Service Security
+    "CHNG",  # Change Management (partially)
+    "DATA",  # Data (partially - encryption, handling)
+    "VULN",  # Vulnerability Management
+    "ITAC",  # IT Accessibility (partially - WCAG checks)
+    "AIML",  # AI/ML Model Security
+    "AILM",  # AI Language Models
+    "AISC",  # AI Security Controls
+    "AIGN",  # AI Governance (partially)
+    "AIQU",  # AI Quality
+    "DPAI",  # Data Privacy - AI
+})
+
+# Specific question IDs that are repo-assessable even if prefix isn't
+_REPO_ASSESSABLE_IDS = frozenset({
+    "DOCU-05",  # Architecture diagrams (check for docs)
+    "DCTR-01", "DCTR-02", "DCTR-03",  # Data center (IaC/cloud config)
+    "OPEM-01", "OPEM-02",  # Operational management (monitoring config)
+    "DRPV-01", "DRPV-02",  # DR/Privacy (backup config)
+    "CONS-01", "CONS-02",  # Consulting (dependency config)
+    "THRD-01", "THRD-02", "THRD-03",  # Third party (dependency manifests)
+    "PCID-01", "PCID-02",  # PCI (payment code patterns)
+    "HIPA-01", "HIPA-02", "HIPA-03",  # HIPAA (PHI handling patterns)
+    "FIDP-01", "FIDP-02", "FIDP-03",  # FERPA/data privacy
+    "PDAT-01", "PDAT-02", "PDAT-03", "PDAT-04",  # Privacy data
+    "PPPR-01", "PPPR-02", "PPPR-03",  # Privacy practices
+})
+
+# IDs that are never repo-assessable (organizational attestation only)
+_NEVER_ASSESSABLE_PREFIXES = frozenset({
+    "GNRL",  # General info (company name, contacts)
+    "COMP",  # Company info (staff, operations)
+    "REQU",  # Required questions (product type routing)
+    "PCOM",  # Privacy company info
+    "PRGN",  # Privacy regional
+    "INTL",  # International
+    "HFIH",  # Health/Financial/Insurance
+    "PCHG",  # Privacy change management
+    "PTHP",  # Privacy third party
+})
+
+
 def parse_hecvat(xlsx_path: str, output_path: str) -> dict:
     try:
         import openpyxl
@@ -22,107 +75,69 @@ def parse_hecvat(xlsx_path: str, output_path: str) -> dict:
         print("ERROR: openpyxl required. Install with: pip install openpyxl", file=sys.stderr)
         sys.exit(1)
 
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
+    # read_only streams the sheet XML instead of building a full cell DOM —
+    # much faster and memory stays bounded for the multi-sheet workbook
+    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True,
+                                keep_links=False)
     ws = wb["Questions"]
 
     # Header row is row 2
-    headers = [c.value for c in ws[2]]
+    headers = list(next(ws.iter_rows(min_row=2, max_row=2, values_only=True)))
 
     # Sheet presence columns (index 2-9): Start, Org, Product, Infra, Access, Case, AI, Privacy
     sheet_names = ["START HERE", "Organization", "Product", "Infrastructure",
                    "IT Accessibility", "Case-Specific", "AI", "Privacy"]
 
-    # Repo-assessable question prefixes/patterns
-    # These categories contain questions that can typically be answered from code
-    REPO_ASSESSABLE_PREFIXES = {
-        "AAAI",  # Authentication, Authorization, Account Management
-        "APPL",  # Application/Service Security
-        "CHNG",  # Change Management (partially)
-        "DATA",  # Data (partially - encryption, handling)
-        "VULN",  # Vulnerability Management
-        "ITAC",  # IT Accessibility (partially - WCAG checks)
-        "AIML",  # AI/ML Model Security
-        "AILM",  # AI Language Models
-        "AISC",  # AI Security Controls
-        "AIGN",  # AI Governance (partially)
-        "AIQU",  # AI Quality
-        "DPAI",  # Data Privacy - AI
-    }
-
-    # Specific question IDs that are repo-assessable even if prefix isn't
-    REPO_ASSESSABLE_IDS = {
-        "DOCU-05",  # Architecture diagrams (check for docs)
-        "DCTR-01", "DCTR-02", "DCTR-03",  # Data center (IaC/cloud config)
-        "OPEM-01", "OPEM-02",  # Operational management (monitoring config)
-        "DRPV-01", "DRPV-02",  # DR/Privacy (backup config)
-        "CONS-01", "CONS-02",  # Consulting (dependency config)
-        "THRD-01", "THRD-02", "THRD-03",  # Third party (dependency manifests)
-        "PCID-01", "PCID-02",  # PCI (payment code patterns)
-        "HIPA-01", "HIPA-02", "HIPA-03",  # HIPAA (PHI handling patterns)
-        "FIDP-01", "FIDP-02", "FIDP-03",  # FERPA/data privacy
-        "PDAT-01", "PDAT-02", "PDAT-03", "PDAT-04",  # Privacy data
-        "PPPR-01", "PPPR-02", "PPPR-03",  # Privacy practices
-    }
-
-    # IDs that are never repo-assessable (organizational attestation only)
-    NEVER_ASSESSABLE_PREFIXES = {
-        "GNRL",  # General info (company name, contacts)
-        "COMP",  # Company info (staff, operations)
-        "REQU",  # Required questions (product type routing)
-        "PCOM",  # Privacy company info
-        "PRGN",  # Privacy regional
-        "INTL",  # International
-        "HFIH",  # Health/Financial/Insurance
-        "PCHG",  # Privacy change management
-        "PTHP",  # Privacy third party
-    }
-
     questions = []
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row, values_only=True):
-        qid = row[0]
-        if not qid or not isinstance(qid, str) or "-" not in qid:
+    # max_col=24 pins the row width so each row unpacks directly into named
+    # fields instead of ~20 per-row subscript lookups
+    for (qid, question_text, *presence, score_mapping, score_location,
+         has_additional_info, if_then, standard_guidance, no_guidance,
+         yes_guidance, na_guidance, reason, followup, compliant_response,
+         _scoring, default_importance, default_weight) in ws.iter_rows(
+            min_row=3, max_row=ws.max_row, max_col=24, values_only=True):
+        if not isinstance(qid, str):
+            continue
+        m = _QID_RE.match(qid)
+        if not m:
             continue
 
-        prefix = qid.split("-")[0]
+        prefix = m.group(1)
 
-        # Determine repo-assessability
-        if prefix in NEVER_ASSESSABLE_PREFIXES:
-            repo_assessable = False
-        elif prefix in REPO_ASSESSABLE_PREFIXES or qid in REPO_ASSESSABLE_IDS:
-            repo_assessable = True
-        else:
-            # Default: not repo-assessable (organizational attestation)
-            repo_assessable = False
+        # Determine repo-assessability; the default for uncategorized prefixes
+        # is organizational attestation (not repo-assessable)
+        repo_assessable = (prefix not in _NEVER_ASSESSABLE_PREFIXES
+                           and (prefix in _REPO_ASSESSABLE_PREFIXES
+                                or qid in _REPO_ASSESSABLE_IDS))
 
-        # Sheet presence
-        sheets_present = []
-        for i, sname in enumerate(sheet_names):
-            val = row[2 + i] if (2 + i) < len(row) else None
-            if val and val == 1:
-                sheets_present.append(sname)
+        # Sheet presence (columns 3-10 pair up with sheet_names)
+        sheets_present = [sname for sname, val in zip(sheet_names, presence)
+                          if val == 1]
 
         question = {
             "id": qid,
             "category": prefix,
-            "question": row[1],
+            "question": question_text,
             "sheets": sheets_present,
-            "score_mapping": row[10],
-            "score_location": row[11],
-            "has_additional_info": bool(row[12]),
-            "if_then": row[13] if row[13] else None,
-            "standard_guidance": row[14] if row[14] else None,
-            "no_guidance": row[15] if row[15] else None,
-            "yes_guidance": row[16] if row[16] else None,
-            "na_guidance": row[17] if row[17] else None,
-            "reason": row[18] if row[18] else None,
-            "followup": row[19] if row[19] else None,
-            "compliant_response": row[20] if row[20] else None,
-            "default_importance": row[22] if row[22] else None,
-            "default_weight": row[23] if row[23] else None,
+            "score_mapping": score_mapping,
+            "score_location": score_location,
+            "has_additional_info": bool(has_additional_info),
+            "if_then": if_then if if_then else None,
+            "standard_guidance": standard_guidance if standard_guidance else None,
+            "no_guidance": no_guidance if no_guidance else None,
+            "yes_guidance": yes_guidance if yes_guidance else None,
+            "na_guidance": na_guidance if na_guidance else None,
+            "reason": reason if reason else None,
+            "followup": followup if followup else None,
+            "compliant_response": compliant_response if compliant_response else None,
+            "default_importance": default_importance if default_importance else None,
+            "default_weight": default_weight if default_weight else None,
             "repo_assessable": repo_assessable,
         }
         questions.append(question)
 
+    wb.close()
+
     # Build the output
     result = {
         "source_file": os.path.basename(xlsx_path),
@@ -135,8 +150,7 @@ def parse_hecvat(xlsx_path: str, output_path: str) -> dict:
         "questions": questions,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2)
+    _dump_json(result, output_path, indent=True)
 
     print(f"Parsed {result['total_questions']} questions "
           f"({result['repo_assessable_count']} repo-assessable, "
@@ -0,0 +1,37 @@
+"""Assertion-free helpers shared by the test modules.
+
+PYTEST_DONT_REWRITE
+
+The marker above opts this module out of pytest's assertion rewriting:
+nothing here asserts, so there is no introspection to gain, and skipping
+the AST parse/rewrite/re-compile shaves collection time (which multiplies
+under xdist, where every worker re-collects).
+"""
+
+from _jsonio import dump as _dump_json
+
+
+def _parse_md_sections(content):
+    """Index a report's table data rows by ``## `` section heading.
+
+    One pass over the report replaces the per-test "find section X, collect
+    rows until the next ##" scan; header and separator rows are dropped so
+    consumers only see data rows.
+    """
+    sections = {}
+    rows = None
+    for line in content.splitlines():
+        if line.startswith("## "):
+            rows = sections[line[3:].strip()] = []
+        elif (rows is not None and line.startswith("| ")
+              and "---" not in line and not line.startswith("| Question")
+              and not line.startswith("| Category")):
+            rows.append(line)
+    return sections
+
+
+def _write_assessment(tmp_path, filename, data):
+    """Write assessment JSON to a temp file and return its path."""
+    path = tmp_path / filename
+    _dump_json(data, path)
+    return str(path)
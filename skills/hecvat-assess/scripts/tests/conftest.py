@@ -1,85 +1,349 @@
 """Pytest configuration and shared fixtures for HECVAT testing."""
 
+import copy
+import functools
+import hashlib
 import json
 import os
+import shutil
+import sys
 import pytest
-from pathlib import Path
+from collections import defaultdict
 
 
-# Path constants — SKILL_ROOT points to skills/hecvat-assess/ (2 levels up from tests/)
-SKILL_ROOT = Path(__file__).parent.parent.parent
-HECVAT_XLSX = SKILL_ROOT / "HECVAT414.xlsx"
-SCRIPTS_DIR = SKILL_ROOT / "scripts"
+# Path constants resolved once at import as plain strings (the scripts take
+# string arguments anyway, so there is no pathlib round-trip per fixture).
+# SKILL_ROOT points to skills/hecvat-assess/ (2 levels up from tests/).
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SKILL_ROOT = os.path.dirname(os.path.dirname(_HERE))
+HECVAT_XLSX = os.path.join(SKILL_ROOT, "HECVAT414.xlsx")
 
+# Canned assessment payloads live as JSON next to the tests instead of dict
+# literals in this file
+_FIXTURES_DIR = os.path.join(_HERE, "fixtures")
 
-@pytest.fixture
+try:
+    # orjson parses the fixture bytes in C instead of executing BUILD_MAP
+    # bytecode per fixture setup
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _clone(obj):
+        # For JSON-shaped payloads a serialize/parse round-trip in C beats
+        # copy.deepcopy's generic memo-dict walk
+        return orjson.loads(orjson.dumps(obj))
+except ImportError:
+    _json_loads = json.loads
+    _clone = copy.deepcopy
+
+
+def _intern_strings(obj):
+    """Recursively intern the keys and short string values of a payload.
+
+    The canned payloads repeat the same handful of strings ("Yes", "No",
+    "answer", ...); interning lets later equality checks short-circuit on
+    identity and deduplicates the copies the JSON parser produced.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(v) for v in obj]
+    if isinstance(obj, str) and len(obj) < 32:
+        return sys.intern(obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(name):
+    """Parse tests/fixtures/<name> once; callers copy before mutating."""
+    with open(os.path.join(_FIXTURES_DIR, name), 'rb') as f:
+        return _intern_strings(_json_loads(f.read()))
+
+
+# Short param names for the canned payloads (see assessment_data below)
+_ASSESSMENT_FIXTURES = {
+    "sample": "sample_assessment.json",
+    "empty": "empty_assessment.json",
+    "invalid_ids": "assessment_with_invalid_ids.json",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _check_hecvat():
+    """Probe the xlsx once per session instead of once per fixture setup.
+
+    The 4-byte zip-magic sniff catches a truncated or non-xlsx file up front
+    with a clear message, instead of an opaque failure deep inside openpyxl
+    after a full parse attempt.
+    """
+    assert os.path.exists(HECVAT_XLSX), f"HECVAT414.xlsx not found at {HECVAT_XLSX}"
+    with open(HECVAT_XLSX, "rb") as f:
+        assert f.read(4) == b"PK\x03\x04", \
+            f"HECVAT414.xlsx is not a valid zip/xlsx: {HECVAT_XLSX}"
+    return HECVAT_XLSX
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on the same pytest-xdist worker")
+    config.addinivalue_line(
+        "markers",
+        "integration: touches the real HECVAT xlsx (slow)")
+    if os.environ.get("HECVAT_FAST"):
+        # Inner-loop profile: bail on the first failure and skip everything
+        # that opens the real workbook, leaving the sub-second logic tests.
+        # (-x is sugar for maxfail=1; there is no "exitfirst" option attr)
+        config.option.maxfail = 1
+        if not config.option.markexpr:
+            config.option.markexpr = "not integration"
+
+
+# Fixtures that open or derive from the real HECVAT414.xlsx
+_XLSX_FIXTURES = {"hecvat_xlsx_path", "hecvat_xlsx_str", "hecvat_workbook",
+                  "hecvat_question_ids", "hecvat_qmap", "parsed_hecvat",
+                  "questions_by_category", "filled_report_factory",
+                  "filled_sample_workbook", "hecvat_template_copy"}
+
+
+def pytest_collection_modifyitems(items):
+    """Auto-mark tests by fixture usage.
+
+    Tests that touch the real workbook get ``integration`` (deselected under
+    HECVAT_FAST=1). Tests consuming the session-scoped parse fixtures also
+    get an ``xdist_group`` so that with ``pytest -n auto --dist loadgroup``
+    (pytest-xdist installed) they land on one worker and the xlsx is still
+    parsed only once instead of once per worker. Without the plugin the
+    group marker is inert and the serial run is unchanged.
+    """
+    shared = {"parsed_hecvat", "questions_by_category",
+              "hecvat_workbook", "hecvat_question_ids"}
+    for item in items:
+        fixtures = set(getattr(item, "fixturenames", ()))
+        if _XLSX_FIXTURES & fixtures:
+            item.add_marker(pytest.mark.integration)
+        if shared & fixtures:
+            item.add_marker(pytest.mark.xdist_group("hecvat_parse"))
+
+
+@pytest.fixture(scope="session")
 def hecvat_xlsx_path():
     """Absolute path to the real HECVAT414.xlsx file.
 
     This fixture provides the actual HECVAT file for integration tests.
     Tests can use this to validate parsing against real data.
     """
-    assert HECVAT_XLSX.exists(), f"HECVAT414.xlsx not found at {HECVAT_XLSX}"
-    return str(HECVAT_XLSX)
+    return _check_hecvat()
+
+
+@pytest.fixture(scope="session")
+def hecvat_xlsx_str():
+    """Pre-stringified xlsx path, shared for the whole session.
+
+    Saves the per-test Path-to-str coercion for tests that hand the path
+    straight to the scripts (which take plain string arguments).
+    """
+    return _check_hecvat()
+
+
+@pytest.fixture(scope="session")
+def hecvat_workbook(hecvat_xlsx_path):
+    """The real workbook, opened read_only once and shared for the session.
+
+    Unzipping and XML-parsing the xlsx dominates any test that inspects the
+    template directly; read-only tests share this handle instead of paying
+    the load per test. Tests that mutate a workbook must open their own copy.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(hecvat_xlsx_path, read_only=True, data_only=True,
+                       keep_links=False)
+    yield wb
+    wb.close()
+
+
+@pytest.fixture(scope="session")
+def hecvat_question_ids(hecvat_workbook):
+    """Frozenset of every question id found in the template's Questions sheet."""
+    from generate_report import find_question_cells
+
+    return frozenset(find_question_cells(hecvat_workbook["Questions"]))
+
+
+@pytest.fixture(scope="session")
+def hecvat_qmap(hecvat_workbook):
+    """{sheet_name: {question_id: row}} for every sheet, built once.
+
+    The template is immutable within a session, so the question-cell scan
+    that generate_report would otherwise redo per call happens exactly once;
+    callers pass this straight through as generate_report's qmap argument.
+    """
+    from generate_report import find_all_question_cells
+
+    return find_all_question_cells(hecvat_workbook)
+
+
+@pytest.fixture(scope="session")
+def parsed_hecvat(tmp_path_factory):
+    """Parse the real HECVAT414.xlsx exactly once per test session.
+
+    Parsing the workbook is by far the most expensive operation in the suite,
+    and most tests only read the resulting dict. Sharing one parse across the
+    session instead of re-parsing per test cuts suite runtime dramatically.
+
+    Returns (result_dict, output_file_path). Tests that specifically need a
+    fresh parse (file creation, idempotency) still call parse_hecvat directly.
+    """
+    from parse_hecvat import parse_hecvat
+
+    output_file = tmp_path_factory.mktemp("hecvat") / "parsed.json"
+    result = parse_hecvat(_check_hecvat(), str(output_file))
+    return result, output_file
+
+
+@pytest.fixture(scope="session")
+def questions_by_category(parsed_hecvat):
+    """Index the parsed questions by category and by id, once per session.
+
+    The business-logic tests each need "all questions in category X" or "the
+    question with id Y"; building the index once replaces repeated linear
+    scans of the full question list with dict lookups.
+
+    Returns (category_index, id_index).
+    """
+    result, _ = parsed_hecvat
+    cat_idx = defaultdict(list)
+    id_idx = {}
+    for q in result["questions"]:
+        cat_idx[q["category"]].append(q)
+        id_idx[q["id"]] = q
+    return cat_idx, id_idx
+
+
+@pytest.fixture(scope="session")
+def filled_report_factory(tmp_path_factory, hecvat_qmap):
+    """Factory that fills the template once per distinct payload.
+
+    Reports are cached on disk under tests/.cache keyed by a hash of the
+    payload, so repeated sessions skip the openpyxl write cycle entirely;
+    cache misses reuse the session qmap instead of rescanning the template.
+    Only suitable for tests that read the filled output; tests asserting
+    write-path behavior itself (fresh file creation, today's date) must
+    keep calling generate_report directly.
+    """
+    from generate_report import generate_report
+
+    cache_dir = os.path.join(_HERE, ".cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    scratch = tmp_path_factory.mktemp("filled_reports")
+    # The template's identity is part of the cache key (like the sidecar
+    # caches in the scripts): the cache dir outlives the session, so an
+    # updated HECVAT414.xlsx must invalidate previously filled reports
+    st = os.stat(_check_hecvat())
+    template_stamp = f"{st.st_mtime}:{st.st_size}:"
+
+    def _build(payload):
+        key = hashlib.blake2b(
+            template_stamp.encode() +
+            json.dumps(payload, sort_keys=True).encode(),
+            digest_size=16).hexdigest()
+        cached = os.path.join(cache_dir, f"{key}.xlsx")
+        if not os.path.exists(cached):
+            assessment_file = scratch / f"{key}.json"
+            assessment_file.write_text(json.dumps(payload))
+            generate_report(_check_hecvat(), str(assessment_file), cached,
+                            qmap=hecvat_qmap)
+        return cached
+
+    return _build
+
+
+@pytest.fixture(scope="session")
+def filled_sample_workbook(filled_report_factory, sample_assessment_data_ro):
+    """The sample assessment's filled report, opened read-only once.
+
+    Content tests that only inspect the filled cells share this workbook
+    instead of each running generate_report; the write path itself stays
+    covered by the file-creation and date tests, which keep calling
+    generate_report directly.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filled_report_factory(sample_assessment_data_ro),
+                       read_only=True, data_only=True, keep_links=False)
+    yield wb
+    wb.close()
+
+
+@pytest.fixture
+def hecvat_template_copy(tmp_path):
+    """Private, writable copy of the template under tmp_path.
+
+    Copies with os.copy_file_range where the kernel supports it (in-kernel
+    transfer, reflink-cheap on CoW filesystems), falling back to a buffered
+    copy. Deliberately not a hardlink: saving over a hardlinked path would
+    truncate the shared inode and corrupt the tracked template.
+    """
+    dst = tmp_path / "hecvat.xlsx"
+    src = _check_hecvat()
+    size = os.path.getsize(src)
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(s.fileno(), d.fileno(), size - copied)
+                if n == 0:
+                    break
+                copied += n
+            if copied < size:
+                # File offsets have advanced past the copied bytes, so the
+                # buffered fallback resumes where the kernel stopped
+                shutil.copyfileobj(s, d, 1 << 20)
+        except (AttributeError, OSError):
+            shutil.copyfileobj(s, d, 1 << 20)
+    return str(dst)
+
+
+@pytest.fixture(params=list(_ASSESSMENT_FIXTURES))
+def assessment_data(request):
+    """One fixture sweeping all three canned payloads.
+
+    Cross-cutting tests (robustness across sample/empty/invalid inputs) take
+    this instead of writing three near-identical test bodies; pytest keeps a
+    single fixture node and parametrizes over the payload names.
+    """
+    return _clone(_load_fixture(_ASSESSMENT_FIXTURES[request.param]))
 
 
 @pytest.fixture
 def sample_assessment_data():
-    """Sample assessment JSON data with known answers for testing report generation.
-
-    Includes a variety of answer types:
-    - Simple answers without evidence
-    - Answers with additional_info
-    - Answers with evidence
-    - Answers with both additional_info and evidence
-
-    This lets us test all code paths for filling the xlsx report.
-    """
-    return {
-        "assessment_metadata": {
-            "vendor": "Test Vendor Inc",
-            "product": "Test Product",
-            "assessed_at": "2026-02-13T12:00:00Z",
-            "assessed_by": "Test Assessor"
-        },
-        "answers": {
-            "GNRL-01": {
-                "answer": "Test Vendor Inc",
-                "additional_info": "",
-                "evidence": ""
-            },
-            "GNRL-02": {
-                "answer": "Test Product",
-                "additional_info": "Cloud-based SaaS solution",
-                "evidence": ""
-            },
-            "AAAI-01": {
-                "answer": "Yes",
-                "additional_info": "Multi-factor authentication implemented",
-                "evidence": "auth/mfa.py lines 45-67"
-            },
-            "AAAI-02": {
-                "answer": "Yes",
-                "additional_info": "",
-                "evidence": "Uses bcrypt with salt rounds=12"
-            },
-            "COMP-01": {
-                "answer": "No",
-                "additional_info": "Company has 50-100 employees",
-                "evidence": ""
-            },
-            "DOCU-05": {
-                "answer": "Yes",
-                "additional_info": "",
-                "evidence": "docs/architecture/ contains system diagrams"
-            },
-            "THRD-01": {
-                "answer": "Yes",
-                "additional_info": "All dependencies tracked in package.json and requirements.txt",
-                "evidence": "See package.json:dependencies"
-            }
-        }
-    }
+    """Mutable per-test copy of the sample assessment payload.
+
+    The payload (fixtures/sample_assessment.json) covers all answer shapes —
+    with/without additional_info, with/without evidence, and both combined —
+    so report-filling code paths are all exercised. Use this variant when a
+    test edits answers in place; read-only consumers should take
+    sample_assessment_data_ro and skip the deep copy.
+    """
+    return _clone(_load_fixture(_ASSESSMENT_FIXTURES["sample"]))
+
+
+@pytest.fixture(scope="session")
+def sample_assessment_data_ro():
+    """The shared sample assessment payload, parsed once per session.
+
+    Treat as read-only: tests may serialize or inspect it but must not
+    mutate it. A recursive MappingProxyType freeze would enforce that at
+    write time, but consumers json.dump the payload and proxies are not
+    serializable — so mutation is instead detected at session teardown,
+    which still catches any test silently corrupting its siblings.
+    """
+    payload = _load_fixture(_ASSESSMENT_FIXTURES["sample"])
+    baseline = json.dumps(payload, sort_keys=True)
+    yield payload
+    assert json.dumps(payload, sort_keys=True) == baseline, \
+        "a test mutated sample_assessment_data_ro; use sample_assessment_data"
 
 
 @pytest.fixture
@@ -89,13 +353,7 @@ def empty_assessment_data():
     Tests that report generation handles empty/new assessments gracefully
     without crashing or corrupting the template.
     """
-    return {
-        "assessment_metadata": {
-            "vendor": "Empty Test",
-            "product": "Unanswered Assessment"
-        },
-        "answers": {}
-    }
+    return _clone(_load_fixture(_ASSESSMENT_FIXTURES["empty"]))
 
 
 @pytest.fixture
@@ -108,25 +366,4 @@ def assessment_with_invalid_ids():
     - Question IDs were mistyped
     - Custom questions were added
     """
-    return {
-        "assessment_metadata": {
-            "vendor": "Test Vendor"
-        },
-        "answers": {
-            "GNRL-01": {
-                "answer": "Valid Answer",
-                "additional_info": "",
-                "evidence": ""
-            },
-            "FAKE-99": {
-                "answer": "This ID doesn't exist",
-                "additional_info": "Should be skipped",
-                "evidence": ""
-            },
-            "INVALID-ID": {
-                "answer": "Also invalid",
-                "additional_info": "",
-                "evidence": ""
-            }
-        }
-    }
+    return _clone(_load_fixture(_ASSESSMENT_FIXTURES["invalid_ids"]))
@@ -13,56 +13,113 @@ Tests cover:
 NOTE: These tests use the real scoring-weights.yaml to validate weight loading.
 """
 
-import json
-import sys
+import re
 import os
 from pathlib import Path
 import pytest
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from generate_delta import generate_delta, load_weights
+from generate_delta import generate_delta, load_weights, _generate_delta_core
+from _helpers import _parse_md_sections, _write_assessment
 
 # Path constants — SKILL_ROOT points to skills/hecvat-assess/ (2 levels up from tests/)
 SKILL_ROOT = Path(__file__).parent.parent.parent
 WEIGHTS_YAML = SKILL_ROOT / "references" / "scoring-weights.yaml"
 
+# Every counter the Summary section must carry; the compiled alternation
+# finds them all in one pass over the report instead of one scan per needle
+_SUMMARY_NEEDLES = (
+    "## Summary",
+    "Improvements (No -> Yes):",
+    "Regressions (Yes -> No):",
+    "Newly assessed:",
+    "Unchanged Yes:",
+    "Unchanged No:",
+)
+_SUMMARY_RE = re.compile("|".join(map(re.escape, _SUMMARY_NEEDLES)))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def weights_yaml_path():
     """Absolute path to the real scoring-weights.yaml file.
 
     This fixture provides the actual weights file for integration tests.
     Tests can use this to validate weight loading against real data.
+    Session-scoped: the path never changes, and load_weights itself is
+    memoized per (path, mtime), so the YAML is parsed once per run no
+    matter how many tests consume it.
     """
     assert WEIGHTS_YAML.exists(), f"scoring-weights.yaml not found at {WEIGHTS_YAML}"
     return str(WEIGHTS_YAML)
 
 
-@pytest.fixture
+# Canned assessments, built once at import. Tests and generate_delta treat
+# them as read-only (the pipeline only serializes them), so the fixtures
+# hand out the shared objects without copying.
+_BEFORE_ASSESSMENT = {
+    "assessment_date": "2026-01-15",
+    "branch": "main",
+    "answers": {
+        "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
+        "AAAI-02": {"answer": "No", "additional_info": "Password-only auth"},
+        "AAAI-03": {"answer": "No", "additional_info": ""},
+        "APPL-01": {"answer": "Yes", "additional_info": "Input validation"},
+        "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
+        "DATA-01": {"answer": "No", "additional_info": "Unencrypted at rest"},
+        "DATA-02": {"answer": "No", "additional_info": ""},
+        "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
+    }
+}
+
+_AFTER_ASSESSMENT = {
+    "assessment_date": "2026-02-15",
+    "branch": "feature/security-hardening",
+    "answers": {
+        "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
+        "AAAI-02": {"answer": "Yes", "additional_info": "Added MFA support"},
+        "AAAI-03": {"answer": "No", "additional_info": ""},
+        "APPL-01": {"answer": "No", "additional_info": "Removed validation layer"},
+        "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
+        "DATA-01": {"answer": "Yes", "additional_info": "AES-256 encryption added"},
+        "DATA-02": {"answer": "No", "additional_info": ""},
+        "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
+        "VULN-01": {"answer": "Yes", "additional_info": "Automated scanning"},
+        "VULN-02": {"answer": "No", "additional_info": "Manual process only"},
+    }
+}
+
+_IDENTICAL_ASSESSMENT = {
+    "assessment_date": "2026-01-15",
+    "branch": "main",
+    "answers": {
+        "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
+        "AAAI-02": {"answer": "No", "additional_info": "Password-only auth"},
+        "AAAI-03": {"answer": "No", "additional_info": ""},
+        "APPL-01": {"answer": "Yes", "additional_info": "Input validation"},
+        "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
+        "DATA-01": {"answer": "No", "additional_info": "Unencrypted at rest"},
+        "DATA-02": {"answer": "No", "additional_info": ""},
+        "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
+    }
+}
+
+_EMPTY_ASSESSMENT = {
+    "assessment_date": "2026-01-01",
+    "branch": "empty",
+    "answers": {}
+}
+
+
+@pytest.fixture(scope="module")
 def before_assessment():
     """A baseline assessment with known answers for delta comparison.
 
     Contains a mix of Yes, No, and blank answers across several categories
     so we can test all transition types (improvement, regression, newly assessed).
     """
-    return {
-        "assessment_date": "2026-01-15",
-        "branch": "main",
-        "answers": {
-            "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
-            "AAAI-02": {"answer": "No", "additional_info": "Password-only auth"},
-            "AAAI-03": {"answer": "No", "additional_info": ""},
-            "APPL-01": {"answer": "Yes", "additional_info": "Input validation"},
-            "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
-            "DATA-01": {"answer": "No", "additional_info": "Unencrypted at rest"},
-            "DATA-02": {"answer": "No", "additional_info": ""},
-            "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
-        }
-    }
+    return _BEFORE_ASSESSMENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def after_assessment():
     """A later assessment with known changes relative to before_assessment.
 
@@ -78,45 +135,17 @@ def after_assessment():
     - VULN-01: (new) -> Yes (newly assessed)
     - VULN-02: (new) -> No (newly assessed)
     """
-    return {
-        "assessment_date": "2026-02-15",
-        "branch": "feature/security-hardening",
-        "answers": {
-            "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
-            "AAAI-02": {"answer": "Yes", "additional_info": "Added MFA support"},
-            "AAAI-03": {"answer": "No", "additional_info": ""},
-            "APPL-01": {"answer": "No", "additional_info": "Removed validation layer"},
-            "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
-            "DATA-01": {"answer": "Yes", "additional_info": "AES-256 encryption added"},
-            "DATA-02": {"answer": "No", "additional_info": ""},
-            "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
-            "VULN-01": {"answer": "Yes", "additional_info": "Automated scanning"},
-            "VULN-02": {"answer": "No", "additional_info": "Manual process only"},
-        }
-    }
+    return _AFTER_ASSESSMENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def identical_assessment():
     """An assessment identical to before_assessment for zero-delta testing.
 
     WHY: Using the same data ensures the comparison logic correctly identifies
     that nothing changed, rather than false-positive detecting changes.
     """
-    return {
-        "assessment_date": "2026-01-15",
-        "branch": "main",
-        "answers": {
-            "AAAI-01": {"answer": "Yes", "additional_info": "MFA enabled"},
-            "AAAI-02": {"answer": "No", "additional_info": "Password-only auth"},
-            "AAAI-03": {"answer": "No", "additional_info": ""},
-            "APPL-01": {"answer": "Yes", "additional_info": "Input validation"},
-            "APPL-02": {"answer": "Yes", "additional_info": "XSS protection"},
-            "DATA-01": {"answer": "No", "additional_info": "Unencrypted at rest"},
-            "DATA-02": {"answer": "No", "additional_info": ""},
-            "COMP-01": {"answer": "Yes", "additional_info": "50 employees"},
-        }
-    }
+    return _IDENTICAL_ASSESSMENT
 
 
 @pytest.fixture
@@ -126,19 +155,72 @@ def empty_assessment():
     Tests that delta generation handles empty assessments gracefully
     without crashing or producing incorrect output.
     """
-    return {
-        "assessment_date": "2026-01-01",
-        "branch": "empty",
-        "answers": {}
-    }
+    return _EMPTY_ASSESSMENT
+
+
+def _render_delta(before, after, weights_yaml_path):
+    """Render the delta for in-memory dicts and return the report.
+
+    Calls _generate_delta_core directly — no JSON round-trip, no stdout
+    capture — so content-only tests are pure compute. The path-based
+    wrapper and its stdout echo stay covered by TestOutputFileCreation.
+    """
+    return _generate_delta_core(before, after, load_weights(weights_yaml_path))
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One temp directory shared by the module's file-based tests.
+
+    Per-test tmp_path creates and removes a fresh directory for every test;
+    the few tests that still touch real files only need unique filenames,
+    which they derive from their own test name.
+    """
+    return tmp_path_factory.mktemp("delta_files")
+
+
+@pytest.fixture(scope="module")
+def std_paths(shared_tmp, before_assessment, after_assessment):
+    """(before_path, after_path) for the standard pair, written once.
+
+    The file-based tests all feed generate_delta the same two inputs; only
+    their output paths differ, so the JSON is serialized to disk once per
+    module instead of twice per test.
+    """
+    return (_write_assessment(shared_tmp, "std_before.json", before_assessment),
+            _write_assessment(shared_tmp, "std_after.json", after_assessment))
 
 
-def _write_assessment(tmp_path, filename, data):
-    """Helper to write assessment JSON to a temp file and return its path."""
-    path = tmp_path / filename
-    with open(path, "w") as f:
-        json.dump(data, f)
-    return str(path)
+@pytest.fixture(scope="module")
+def delta_report(before_assessment, after_assessment, weights_yaml_path):
+    """Rendered report for the standard before/after pair, built once.
+
+    The full pipeline (load, weight load, delta compute, markdown render)
+    is identical for every test that only asserts on the report text, so
+    it runs once per module instead of once per test.
+    """
+    return _render_delta(before_assessment, after_assessment,
+                         weights_yaml_path)
+
+
+@pytest.fixture(scope="module")
+def identical_report(before_assessment, identical_assessment,
+                     weights_yaml_path):
+    """Rendered report comparing before_assessment with itself, built once."""
+    return _render_delta(before_assessment, identical_assessment,
+                         weights_yaml_path)
+
+
+@pytest.fixture(scope="module")
+def delta_sections(delta_report):
+    """Section-indexed data rows of the standard report, built once."""
+    return _parse_md_sections(delta_report)
+
+
+@pytest.fixture(scope="module")
+def identical_sections(identical_report):
+    """Section-indexed data rows for the identical-pair report."""
+    return _parse_md_sections(identical_report)
 
 
 class TestLoadWeights:
@@ -192,58 +274,27 @@ class TestIdenticalAssessments:
     should show zero improvements, regressions, and newly assessed items.
     """
 
-    def test_no_improvements_when_identical(self, before_assessment, identical_assessment, weights_yaml_path, tmp_path):
+    def test_no_improvements_when_identical(self, identical_report):
         """Verify zero improvements when both assessments are the same.
 
         WHY: False-positive improvements would mislead stakeholders into
         thinking progress was made when nothing changed.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", identical_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
+        assert "Improvements (No -> Yes): **0**" in identical_report
+        assert "Regressions (Yes -> No): **0**" in identical_report
+        assert "Newly assessed: **0**" in identical_report
 
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "Improvements (No -> Yes): **0**" in content
-        assert "Regressions (Yes -> No): **0**" in content
-        assert "Newly assessed: **0**" in content
-
-    def test_no_category_deltas_when_identical(self, before_assessment, identical_assessment, weights_yaml_path, tmp_path):
+    def test_no_category_deltas_when_identical(self, identical_sections):
         """Verify no category score delta rows when assessments are identical.
 
         WHY: If category deltas show non-zero values for identical data,
         the score calculation is broken.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", identical_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        # The Category Score Deltas table should exist but have no data rows
-        # (only categories with non-zero delta get rows)
-        if "## Category Score Deltas" in content:
-            # Find the table section and check it has no data rows with +/- deltas
-            lines = content.split("\n")
-            in_delta_section = False
-            data_rows = []
-            for line in lines:
-                if "## Category Score Deltas" in line:
-                    in_delta_section = True
-                    continue
-                if in_delta_section and line.startswith("## "):
-                    break
-                if in_delta_section and line.startswith("| ") and "Category" not in line and "---" not in line:
-                    data_rows.append(line)
-
-            assert len(data_rows) == 0, \
-                f"Expected no delta rows for identical assessments, got: {data_rows}"
+        # The Category Score Deltas table may exist but must have no data
+        # rows (only categories with non-zero delta get rows)
+        data_rows = identical_sections.get("Category Score Deltas", [])
+        assert len(data_rows) == 0, \
+            f"Expected no delta rows for identical assessments, got: {data_rows}"
 
 
 class TestImprovements:
@@ -253,60 +304,33 @@ class TestImprovements:
     progress over time.
     """
 
-    def test_improvements_detected(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_improvements_detected(self, delta_report):
         """Verify No->Yes transitions are counted as improvements.
 
         WHY: Missing improvements would undercount progress and mislead
         stakeholders about the security posture trend.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
         # AAAI-02 (No->Yes) and DATA-01 (No->Yes) = 2 improvements
-        assert "Improvements (No -> Yes): **2**" in content
+        assert "Improvements (No -> Yes): **2**" in delta_report
 
-    def test_improvement_questions_listed_in_table(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_improvement_questions_listed_in_table(self, delta_report):
         """Verify improved question IDs appear in the improvements table.
 
         WHY: The table provides actionable detail. Missing question IDs
         would prevent reviewers from understanding what specifically improved.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "AAAI-02" in content, "AAAI-02 improvement should be listed"
-        assert "DATA-01" in content, "DATA-01 improvement should be listed"
+        assert "AAAI-02" in delta_report, "AAAI-02 improvement should be listed"
+        assert "DATA-01" in delta_report, "DATA-01 improvement should be listed"
 
-    def test_improvement_detail_includes_after_info(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_improvement_detail_includes_after_info(self, delta_report):
         """Verify improvement table shows additional_info from the after assessment.
 
         WHY: The detail column helps reviewers understand what was done to
         achieve the improvement, providing context for the change.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "Added MFA support" in content, \
+        assert "Added MFA support" in delta_report, \
             "AAAI-02 detail from after assessment should appear"
-        assert "AES-256 encryption added" in content, \
+        assert "AES-256 encryption added" in delta_report, \
             "DATA-01 detail from after assessment should appear"
 
 
@@ -317,40 +341,22 @@ class TestRegressions:
     degradation that may need immediate attention.
     """
 
-    def test_regressions_detected(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_regressions_detected(self, delta_report):
         """Verify Yes->No transitions are counted as regressions.
 
         WHY: Missed regressions could hide security posture degradation,
         leaving vulnerabilities unaddressed.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
         # APPL-01 (Yes->No) = 1 regression
-        assert "Regressions (Yes -> No): **1**" in content
+        assert "Regressions (Yes -> No): **1**" in delta_report
 
-    def test_regression_questions_listed_in_table(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_regression_questions_listed_in_table(self, delta_report):
         """Verify regressed question IDs appear in the regressions table.
 
         WHY: Identifying the specific regression lets teams prioritize
         remediation efforts on the right questions.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "APPL-01" in content, "APPL-01 regression should be listed"
+        assert "APPL-01" in delta_report, "APPL-01 regression should be listed"
 
 
 class TestNewlyAssessed:
@@ -360,70 +366,56 @@ class TestNewlyAssessed:
     to Yes or No means a question was evaluated for the first time.
     """
 
-    def test_newly_assessed_detected(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_newly_assessed_detected(self, delta_report):
         """Verify blank->Yes and blank->No transitions are counted.
 
         WHY: Tracking newly assessed questions shows assessment coverage
         growth, which is important for compliance completeness.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
         # VULN-01 (new->Yes) and VULN-02 (new->No) = 2 newly assessed
-        assert "Newly assessed: **2**" in content
+        assert "Newly assessed: **2**" in delta_report
 
-    def test_newly_assessed_questions_listed_with_answer(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_newly_assessed_questions_listed_with_answer(self, delta_report):
         """Verify newly assessed table includes both question ID and answer.
 
         WHY: Knowing whether a new question was answered Yes or No is
         critical — a newly assessed No still needs remediation.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "VULN-01" in content, "VULN-01 should be listed as newly assessed"
-        assert "VULN-02" in content, "VULN-02 should be listed as newly assessed"
-
-    def test_na_to_answer_counts_as_newly_assessed(self, weights_yaml_path, tmp_path):
-        """Verify N/A->Yes or N/A->No transitions count as newly assessed.
-
-        WHY: N/A answers are treated as unanswered. When they become Yes or
-        No, the question was effectively assessed for the first time.
+        assert "VULN-01" in delta_report, "VULN-01 should be listed as newly assessed"
+        assert "VULN-02" in delta_report, "VULN-02 should be listed as newly assessed"
+
+    @pytest.mark.parametrize("before_ans,after_ans", [
+        ("N/A", "Yes"),
+        ("N/A", "No"),
+        ("", "Yes"),
+        ("", "No"),
+    ])
+    def test_unanswered_to_answer_counts_as_newly_assessed(
+            self, before_ans, after_ans, weights_yaml_path):
+        """Verify N/A-> or blank->Yes/No transitions count as newly assessed.
+
+        WHY: N/A and blank answers are treated as unanswered. When they
+        become Yes or No, the question was effectively assessed for the
+        first time. One data-driven test sweeps every unanswered-to-answered
+        combination instead of one hand-built pair per transition.
         """
         before = {
             "assessment_date": "2026-01-01", "branch": "main",
             "answers": {
-                "AAAI-01": {"answer": "N/A", "additional_info": ""},
+                "AAAI-01": {"answer": before_ans, "additional_info": ""},
             }
         }
         after = {
             "assessment_date": "2026-02-01", "branch": "main",
             "answers": {
-                "AAAI-01": {"answer": "Yes", "additional_info": "Now applicable"},
+                "AAAI-01": {"answer": after_ans, "additional_info": "Now applicable"},
             }
         }
-        before_path = _write_assessment(tmp_path, "before.json", before)
-        after_path = _write_assessment(tmp_path, "after.json", after)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
+        content = _render_delta(before, after, weights_yaml_path)
 
         assert "Newly assessed: **1**" in content
+        assert "Improvements (No -> Yes): **0**" in content
+        assert "Regressions (Yes -> No): **0**" in content
 
 
 class TestCategoryScoreDeltas:
@@ -433,24 +425,15 @@ class TestCategoryScoreDeltas:
     teams understand which areas improved or degraded most.
     """
 
-    def test_category_deltas_computed(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_category_deltas_computed(self, delta_report):
         """Verify category score deltas appear in the report.
 
         WHY: Category-level deltas provide the strategic view of where
         security posture is improving or degrading.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "## Category Score Deltas" in content
+        assert "## Category Score Deltas" in delta_report
 
-    def test_aaai_category_delta_correct(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_aaai_category_delta_correct(self, delta_sections):
         """Verify AAAI category delta is calculated correctly.
 
         Before: AAAI-01=Yes, AAAI-02=No, AAAI-03=No -> 1/3 = 33.3%
@@ -460,28 +443,9 @@ class TestCategoryScoreDeltas:
         WHY: Verifying a specific calculation catches math errors in the
         percentage computation logic.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        # Find the AAAI row specifically in the Category Score Deltas section
-        lines = content.split("\n")
-        in_delta_section = False
-        aaai_row = None
-        for line in lines:
-            if "## Category Score Deltas" in line:
-                in_delta_section = True
-                continue
-            if in_delta_section and line.startswith("## "):
-                break
-            if in_delta_section and line.startswith("| AAAI "):
-                aaai_row = line
-                break
+        aaai_row = next(
+            (r for r in delta_sections.get("Category Score Deltas", [])
+             if r.startswith("| AAAI ")), None)
 
         assert aaai_row is not None, "AAAI should appear in category deltas"
         assert "1/3" in aaai_row, f"Before should show 1/3, got: {aaai_row}"
@@ -489,7 +453,7 @@ class TestCategoryScoreDeltas:
         assert "+33.3%" in aaai_row or "+33.4%" in aaai_row, \
             f"Delta should be ~+33.3%, got: {aaai_row}"
 
-    def test_appl_category_delta_correct(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_appl_category_delta_correct(self, delta_sections):
         """Verify APPL category delta shows regression.
 
         Before: APPL-01=Yes, APPL-02=Yes -> 2/2 = 100%
@@ -498,33 +462,14 @@ class TestCategoryScoreDeltas:
 
         WHY: Regression deltas must be negative to correctly flag degradation.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        # Find the APPL row specifically in the Category Score Deltas section
-        lines = content.split("\n")
-        in_delta_section = False
-        appl_row = None
-        for line in lines:
-            if "## Category Score Deltas" in line:
-                in_delta_section = True
-                continue
-            if in_delta_section and line.startswith("## "):
-                break
-            if in_delta_section and line.startswith("| APPL "):
-                appl_row = line
-                break
+        appl_row = next(
+            (r for r in delta_sections.get("Category Score Deltas", [])
+             if r.startswith("| APPL ")), None)
 
         assert appl_row is not None, "APPL should appear in category deltas"
         assert "-50.0%" in appl_row, f"Delta should be -50.0%, got: {appl_row}"
 
-    def test_unchanged_category_not_in_delta_table(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_unchanged_category_not_in_delta_table(self, delta_sections):
         """Verify categories with zero delta are excluded from the table.
 
         COMP has Yes->Yes (unchanged), so its delta is 0 and should not
@@ -533,17 +478,7 @@ class TestCategoryScoreDeltas:
         WHY: Zero-delta rows add noise. Only categories with actual changes
         should appear, making the report actionable.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        lines = content.split("\n")
-        for line in lines:
+        for line in delta_sections.get("Category Score Deltas", []):
             if line.startswith("| COMP"):
                 pytest.fail(f"COMP should not appear in delta table (zero delta), but found: {line}")
 
@@ -555,45 +490,44 @@ class TestOutputFileCreation:
     or print to stdout when no path is given.
     """
 
-    def test_output_file_created(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_output_file_created(self, std_paths, weights_yaml_path, shared_tmp, request):
         """Verify output markdown file is created at the specified path.
 
         WHY: If file creation fails, downstream workflows that depend on
         the delta report file would break.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
+        before_path, after_path = std_paths
+        output_path = str(shared_tmp / f"{request.node.name}_delta.md")
 
         assert not os.path.exists(output_path), "Output file should not exist yet"
 
         generate_delta(before_path, after_path, weights_yaml_path, output_path)
 
-        assert os.path.exists(output_path), "Output file was not created"
-        assert os.path.getsize(output_path) > 0, "Output file is empty"
+        # One stat covers both checks: it raises FileNotFoundError if the
+        # file was never created, and its size proves the write happened
+        st = os.stat(output_path)
+        assert st.st_size > 0, "Output file is empty"
 
-    def test_output_file_in_nested_directory(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_output_file_in_nested_directory(self, std_paths, weights_yaml_path, shared_tmp):
         """Verify output file creation works with nested directories.
 
         WHY: The function uses os.makedirs to create parent directories.
         This tests that nested paths work correctly.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "reports" / "delta" / "output.md")
+        before_path, after_path = std_paths
+        output_path = str(shared_tmp / "reports" / "delta" / "output.md")
 
         generate_delta(before_path, after_path, weights_yaml_path, output_path)
 
         assert os.path.exists(output_path), "Output file was not created in nested dir"
 
-    def test_stdout_when_no_output_path(self, before_assessment, after_assessment, weights_yaml_path, tmp_path, capsys):
+    def test_stdout_when_no_output_path(self, std_paths, weights_yaml_path, capsys):
         """Verify report is printed to stdout when no output path given.
 
         WHY: Stdout output is useful for piping into other tools or for
         quick visual inspection without creating files.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
+        before_path, after_path = std_paths
 
         generate_delta(before_path, after_path, weights_yaml_path)
 
@@ -609,98 +543,49 @@ class TestMarkdownOutput:
     in GitHub, documentation systems, or other markdown viewers.
     """
 
-    def test_report_has_title(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_report_has_title(self, delta_report):
         """Verify report starts with the expected H1 title.
 
         WHY: The title identifies the document type. Missing titles make
         reports harder to identify in a collection of documents.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
+        assert delta_report.startswith("# HECVAT Assessment Delta Report")
 
-        with open(output_path) as f:
-            content = f.read()
-
-        assert content.startswith("# HECVAT Assessment Delta Report")
-
-    def test_report_includes_metadata(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_report_includes_metadata(self, delta_report):
         """Verify report includes before/after assessment metadata.
 
         WHY: Metadata (dates, branches) provides context for the comparison
         and helps reviewers understand what changed and when.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
+        assert "2026-01-15" in delta_report, "Before date should appear"
+        assert "2026-02-15" in delta_report, "After date should appear"
+        assert "main" in delta_report, "Before branch should appear"
+        assert "feature/security-hardening" in delta_report, "After branch should appear"
 
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "2026-01-15" in content, "Before date should appear"
-        assert "2026-02-15" in content, "After date should appear"
-        assert "main" in content, "Before branch should appear"
-        assert "feature/security-hardening" in content, "After branch should appear"
-
-    def test_report_has_summary_section(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_report_has_summary_section(self, delta_report):
         """Verify report has a Summary section with all expected counters.
 
         WHY: The summary gives a quick overview. Missing counters would
         force reviewers to manually count rows in tables.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
+        missing = set(_SUMMARY_NEEDLES) - set(_SUMMARY_RE.findall(delta_report))
+        assert not missing, f"Summary counters missing: {sorted(missing)}"
 
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "## Summary" in content
-        assert "Improvements (No -> Yes):" in content
-        assert "Regressions (Yes -> No):" in content
-        assert "Newly assessed:" in content
-        assert "Unchanged Yes:" in content
-        assert "Unchanged No:" in content
-
-    def test_improvements_table_has_correct_headers(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_improvements_table_has_correct_headers(self, delta_report):
         """Verify improvements table has the expected column headers.
 
         WHY: Table headers define the data structure. Wrong headers would
         misalign data and confuse readers.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
+        assert "| Question | Category | Detail |" in delta_report
 
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "| Question | Category | Detail |" in content
-
-    def test_newly_assessed_table_has_correct_headers(self, before_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_newly_assessed_table_has_correct_headers(self, delta_report):
         """Verify newly assessed table has the expected column headers.
 
         WHY: The newly assessed table has a different structure (includes
         Answer column). Verifying headers catches column layout errors.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
-
-        assert "| Question | Answer | Category |" in content
+        assert "| Question | Answer | Category |" in delta_report
 
 
 class TestEmptyAssessments:
@@ -710,39 +595,27 @@ class TestEmptyAssessments:
     without crashing or producing misleading output.
     """
 
-    def test_both_empty_assessments(self, empty_assessment, weights_yaml_path, tmp_path):
+    def test_both_empty_assessments(self, empty_assessment, weights_yaml_path):
         """Verify comparing two empty assessments does not crash.
 
         WHY: Empty assessments can occur at the start of a new project
         before any questions have been evaluated.
         """
-        before_path = _write_assessment(tmp_path, "before.json", empty_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", empty_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
+        content = _render_delta(empty_assessment, empty_assessment,
+                                weights_yaml_path)
 
         assert "Improvements (No -> Yes): **0**" in content
         assert "Regressions (Yes -> No): **0**" in content
         assert "Newly assessed: **0**" in content
 
-    def test_empty_before_all_new_after(self, empty_assessment, after_assessment, weights_yaml_path, tmp_path):
+    def test_empty_before_all_new_after(self, empty_assessment, after_assessment, weights_yaml_path):
         """Verify all questions in after are counted as newly assessed when before is empty.
 
         WHY: First assessment after an empty baseline means everything is new.
         All Yes/No answers should be treated as newly assessed.
         """
-        before_path = _write_assessment(tmp_path, "before.json", empty_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", after_assessment)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
+        content = _render_delta(empty_assessment, after_assessment,
+                                weights_yaml_path)
 
         # All 10 questions in after_assessment have Yes or No answers,
         # and none exist in the empty before -> all newly assessed
@@ -751,23 +624,24 @@ class TestEmptyAssessments:
         # All 10 answers should be newly assessed
         assert "Newly assessed: **10**" in content
 
-    def test_all_answers_removed(self, before_assessment, empty_assessment, weights_yaml_path, tmp_path):
+    def test_all_answers_removed(self, std_paths, empty_assessment, weights_yaml_path, shared_tmp, request):
         """Verify report handles case where all answers are removed.
 
         WHY: Removing all answers (answered -> empty) is an edge case that
         should not crash. Questions that go from Yes/No to missing should
         not produce false improvements or regressions.
         """
-        before_path = _write_assessment(tmp_path, "before.json", before_assessment)
-        after_path = _write_assessment(tmp_path, "after.json", empty_assessment)
-        output_path = str(tmp_path / "delta.md")
+        name = request.node.name
+        before_path = std_paths[0]
+        after_path = _write_assessment(shared_tmp, f"{name}_after.json", empty_assessment)
+        output_path = str(shared_tmp / f"{name}_delta.md")
 
         # Should not raise exception
         generate_delta(before_path, after_path, weights_yaml_path, output_path)
 
         assert os.path.exists(output_path), "Output file should still be created"
 
-    def test_missing_metadata_uses_fallback(self, weights_yaml_path, tmp_path):
+    def test_missing_metadata_uses_fallback(self, weights_yaml_path):
         """Verify report uses '?' fallback when metadata fields are missing.
 
         WHY: Assessments may lack metadata fields. The report should still
@@ -775,14 +649,7 @@ class TestEmptyAssessments:
         """
         before = {"answers": {}}
         after = {"answers": {}}
-        before_path = _write_assessment(tmp_path, "before.json", before)
-        after_path = _write_assessment(tmp_path, "after.json", after)
-        output_path = str(tmp_path / "delta.md")
-
-        generate_delta(before_path, after_path, weights_yaml_path, output_path)
-
-        with open(output_path) as f:
-            content = f.read()
+        content = _render_delta(before, after, weights_yaml_path)
 
         assert "**Before**: ? on `?`" in content
         assert "**After**: ? on `?`" in content
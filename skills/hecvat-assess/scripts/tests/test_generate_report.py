@@ -11,15 +11,11 @@ Tests cover:
 NOTE: Requires openpyxl for xlsx manipulation. Install with: pip install openpyxl
 """
 
-import json
-import sys
-import os
-from pathlib import Path
 import pytest
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from generate_report import generate_report, find_question_cells
+from generate_report import (generate_report, find_question_cells,
+                             find_all_question_cells)
+from _helpers import _write_assessment
 
 try:
     import openpyxl
@@ -34,38 +30,33 @@ class TestGenerateReportFileCreation:
     errors or corruption.
     """
 
-    def test_output_file_is_created(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
-        """Verify output xlsx file is created.
+    def test_output_file_is_created(self, hecvat_xlsx_path, assessment_data, tmp_path):
+        """Verify output xlsx file is created for every canned payload.
 
         WHY: If file creation fails, downstream users won't have a report to
-        submit. This is the most basic requirement.
+        submit. This is the most basic requirement, and it must hold for
+        sample, empty, and invalid-id assessments alike.
         """
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", assessment_data)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
         assert not output_file.exists(), "Output file already exists"
 
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         assert output_file.exists(), "Output file was not created"
         assert output_file.stat().st_size > 0, "Output file is empty"
 
-    def test_output_file_is_valid_xlsx(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_output_file_is_valid_xlsx(self, hecvat_xlsx_path, sample_assessment_data_ro, tmp_path):
         """Verify output file can be loaded by openpyxl without errors.
 
         WHY: Corrupted xlsx files would be unusable. This catches binary
         corruption, invalid XML, or structural damage to the xlsx format.
         """
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", sample_assessment_data_ro)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         # Try to load the output file
         try:
@@ -75,24 +66,20 @@ class TestGenerateReportFileCreation:
         except Exception as e:
             pytest.fail(f"Output xlsx is corrupted or invalid: {e}")
 
-    def test_template_sheets_are_preserved(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_template_sheets_are_preserved(self, hecvat_xlsx_path, hecvat_workbook,
+                                           sample_assessment_data_ro, tmp_path):
         """Verify all template sheets exist in the output file.
 
         WHY: Missing sheets would make the report incomplete or unusable.
         This catches bugs where sheets are accidentally deleted during processing.
         """
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", sample_assessment_data_ro)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
+        # Original sheet names from the shared session workbook
+        template_sheets = set(hecvat_workbook.sheetnames)
 
-        # Get original sheet names
-        wb_template = openpyxl.load_workbook(str(hecvat_xlsx_path))
-        template_sheets = set(wb_template.sheetnames)
-        wb_template.close()
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         # Get output sheet names
         wb_output = openpyxl.load_workbook(str(output_file))
@@ -111,25 +98,15 @@ class TestGenerateReportAnswerFilling:
     and Column D with additional information.
     """
 
-    def test_answer_fills_column_c(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_answer_fills_column_c(self, filled_sample_workbook):
         """Verify answers are written to Column C.
 
         WHY: Column C is the designated answer column in HECVAT. Wrong column
         would make the report invalid and confusing to reviewers.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
-
         # Check GNRL-01 on START HERE sheet (should always be there)
-        ws = wb["START HERE"]
-        qmap = find_question_cells(ws, ws.max_row)
+        ws = filled_sample_workbook["START HERE"]
+        qmap = find_question_cells(ws)
 
         if "GNRL-01" in qmap:
             row = qmap["GNRL-01"]
@@ -137,27 +114,15 @@ class TestGenerateReportAnswerFilling:
             assert answer_cell == "Test Vendor Inc", \
                 f"GNRL-01 answer not in Column C. Got: {answer_cell}"
 
-        wb.close()
-
-    def test_additional_info_fills_column_d(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_additional_info_fills_column_d(self, filled_sample_workbook):
         """Verify additional_info is written to Column D.
 
         WHY: Column D is for supplementary information. This field provides
         context and evidence for answers.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
-
         # Check GNRL-02 which has additional_info
-        ws = wb["START HERE"]
-        qmap = find_question_cells(ws, ws.max_row)
+        ws = filled_sample_workbook["START HERE"]
+        qmap = find_question_cells(ws)
 
         if "GNRL-02" in qmap:
             row = qmap["GNRL-02"]
@@ -165,30 +130,19 @@ class TestGenerateReportAnswerFilling:
             assert additional_cell == "Cloud-based SaaS solution", \
                 f"GNRL-02 additional_info not in Column D. Got: {additional_cell}"
 
-        wb.close()
-
-    def test_evidence_fills_column_d(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_evidence_fills_column_d(self, filled_sample_workbook):
         """Verify evidence is written to Column D with 'Evidence:' prefix.
 
         WHY: Evidence helps reviewers verify answers. The prefix distinguishes
         evidence from regular additional_info.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        wb = filled_sample_workbook
 
         # AAAI-02 has evidence but no additional_info
         # Need to find which sheet AAAI-02 is on
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            qmap = find_question_cells(ws, ws.max_row)
+        for sheet_name, qmap in find_all_question_cells(wb).items():
             if "AAAI-02" in qmap:
+                ws = wb[sheet_name]
                 row = qmap["AAAI-02"]
                 additional_cell = ws.cell(row=row, column=4).value
                 assert additional_cell is not None, "AAAI-02 evidence not written"
@@ -198,29 +152,18 @@ class TestGenerateReportAnswerFilling:
                     f"Evidence content missing. Got: {additional_cell}"
                 break
 
-        wb.close()
-
-    def test_both_additional_info_and_evidence_combined(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_both_additional_info_and_evidence_combined(self, filled_sample_workbook):
         """Verify additional_info and evidence are combined in Column D.
 
         WHY: When both fields are present, they should be formatted together
         with proper separation. Tests the formatting logic.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        wb = filled_sample_workbook
 
         # AAAI-01 has both additional_info and evidence
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            qmap = find_question_cells(ws, ws.max_row)
+        for sheet_name, qmap in find_all_question_cells(wb).items():
             if "AAAI-01" in qmap:
+                ws = wb[sheet_name]
                 row = qmap["AAAI-01"]
                 col_d = ws.cell(row=row, column=4).value
                 assert col_d is not None, "Column D is empty"
@@ -232,41 +175,28 @@ class TestGenerateReportAnswerFilling:
                     f"Evidence content missing. Got: {col_d}"
                 break
 
-        wb.close()
-
-    def test_multiple_sheets_are_filled(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_multiple_sheets_are_filled(self, filled_sample_workbook):
         """Verify answers appear on the correct sheets.
 
         WHY: Questions may appear on multiple sheets. All occurrences should
         be filled, not just the first one found.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        wb = filled_sample_workbook
 
         # GNRL-01 appears on all sheets - check multiple
         gnrl_01_count = 0
+        qmaps = find_all_question_cells(wb)
         for sheet_name in ["START HERE", "Organization", "Product"]:
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                qmap = find_question_cells(ws, ws.max_row)
-                if "GNRL-01" in qmap:
-                    row = qmap["GNRL-01"]
-                    answer = ws.cell(row=row, column=3).value
-                    if answer == "Test Vendor Inc":
-                        gnrl_01_count += 1
+            qmap = qmaps.get(sheet_name, {})
+            if "GNRL-01" in qmap:
+                row = qmap["GNRL-01"]
+                answer = wb[sheet_name].cell(row=row, column=3).value
+                if answer == "Test Vendor Inc":
+                    gnrl_01_count += 1
 
         assert gnrl_01_count >= 2, \
             f"GNRL-01 should appear on multiple sheets. Found on {gnrl_01_count} sheets."
 
-        wb.close()
-
 
 class TestGenerateReportDateCompletion:
     """Tests validating date completion on START HERE sheet.
@@ -275,21 +205,19 @@ class TestGenerateReportDateCompletion:
     was finalized.
     """
 
-    def test_date_completed_is_filled(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_date_completed_is_filled(self, hecvat_xlsx_path, sample_assessment_data_ro, tmp_path):
         """Verify 'Date Completed' field is filled with current date.
 
         WHY: Date tracking is required for audit purposes. Missing dates would
         make it unclear when the assessment was completed.
         """
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", sample_assessment_data_ro)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        # The returned in-memory workbook is what was just saved, so the
+        # content checks skip a full reload; round-trip fidelity is covered
+        # by test_output_file_is_valid_xlsx
+        wb = generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
         ws = wb["START HERE"]
 
         # Find "Date Completed" row
@@ -307,7 +235,7 @@ class TestGenerateReportDateCompletion:
         assert date_found, "Could not find 'Date Completed' field on START HERE sheet"
         wb.close()
 
-    def test_date_is_current_date(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_date_is_current_date(self, hecvat_xlsx_path, sample_assessment_data_ro, tmp_path):
         """Verify date completed matches today's date.
 
         WHY: Stale or incorrect dates would be misleading. The date should
@@ -315,15 +243,13 @@ class TestGenerateReportDateCompletion:
         """
         from datetime import datetime
 
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", sample_assessment_data_ro)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        # The returned in-memory workbook is what was just saved, so the
+        # content checks skip a full reload; round-trip fidelity is covered
+        # by test_output_file_is_valid_xlsx
+        wb = generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
         ws = wb["START HERE"]
 
         expected_date = datetime.now().strftime("%Y-%m-%d")
@@ -350,45 +276,76 @@ class TestGenerateReportEdgeCases:
         """Verify empty assessment (no answers) produces valid xlsx.
 
         WHY: Users may generate a blank report template for manual completion.
-        Empty data should not crash or corrupt the file.
+        Empty data should not crash or corrupt the file, and the Date
+        Completed stamp is written regardless of answer count.
         """
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", empty_assessment_data)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(empty_assessment_data, f)
-
         # Should not raise exception
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         assert output_file.exists(), "Output file not created for empty assessment"
 
-        # Verify it's valid
+        # Verify it's valid and still carries the Date Completed stamp
         wb = openpyxl.load_workbook(str(output_file))
-        assert wb is not None
+        ws = wb["START HERE"]
+        for row_num in range(1, 10):
+            cell_a = ws.cell(row=row_num, column=1).value
+            if cell_a and "Date Completed" in str(cell_a):
+                assert ws.cell(row=row_num, column=3).value is not None, \
+                    "Date Completed not stamped for empty assessment"
+                break
+        wb.close()
+
+    def test_in_place_overwrite_of_template_copy(self, hecvat_template_copy,
+                                                 sample_assessment_data_ro, tmp_path):
+        """Verify filling a report over its own template copy keeps it valid.
+
+        WHY: Users may point the output at their working copy of the template
+        instead of a new file. The load-then-save-in-place cycle must not
+        corrupt the workbook or drop the filled answers.
+        """
+        assessment_file = _write_assessment(tmp_path, "assessment.json", sample_assessment_data_ro)
+
+        generate_report(hecvat_template_copy, assessment_file, hecvat_template_copy)
+
+        # Reload from disk: the overwritten copy must still be a valid,
+        # filled workbook
+        wb = openpyxl.load_workbook(hecvat_template_copy)
+        ws = wb["START HERE"]
+        qmap = find_question_cells(ws)
+
+        if "GNRL-01" in qmap:
+            row = qmap["GNRL-01"]
+            answer = ws.cell(row=row, column=3).value
+            assert answer == "Test Vendor Inc", "Answer lost in in-place overwrite"
+
         wb.close()
 
-    def test_invalid_question_ids_are_skipped(self, hecvat_xlsx_path, assessment_with_invalid_ids, tmp_path):
+    def test_invalid_question_ids_are_skipped(self, hecvat_xlsx_path, assessment_with_invalid_ids,
+                                              hecvat_question_ids, tmp_path):
         """Verify questions with non-existent IDs are silently skipped.
 
         WHY: Assessment may contain IDs from different HECVAT versions or
         custom questions. Invalid IDs should not crash the generator.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
+        # The fixture's fake ids must genuinely be absent from the template,
+        # or this test would pass without exercising the skip path at all
+        assert "FAKE-99" not in hecvat_question_ids
+        assert "INVALID-ID" not in hecvat_question_ids
 
-        with open(assessment_file, "w") as f:
-            json.dump(assessment_with_invalid_ids, f)
+        assessment_file = _write_assessment(tmp_path, "assessment.json", assessment_with_invalid_ids)
+        output_file = tmp_path / "output.xlsx"
 
         # Should not raise exception
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        wb = generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         assert output_file.exists(), "Output file not created"
 
-        # Verify valid question was filled
-        wb = openpyxl.load_workbook(str(output_file))
+        # Verify valid question was filled, against the returned workbook
         ws = wb["START HERE"]
-        qmap = find_question_cells(ws, ws.max_row)
+        qmap = find_question_cells(ws)
 
         if "GNRL-01" in qmap:
             row = qmap["GNRL-01"]
@@ -412,14 +369,11 @@ class TestGenerateReportEdgeCases:
             }
         }
 
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", malformed_data)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(malformed_data, f)
-
         # Should not raise exception
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
+        generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
 
         assert output_file.exists()
 
@@ -444,23 +398,21 @@ class TestGenerateReportEdgeCases:
             }
         }
 
-        assessment_file = tmp_path / "assessment.json"
+        assessment_file = _write_assessment(tmp_path, "assessment.json", data_with_nones)
         output_file = tmp_path / "output.xlsx"
 
-        with open(assessment_file, "w") as f:
-            json.dump(data_with_nones, f)
-
         # Should not raise exception
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
+        # The returned in-memory workbook is what was just saved, so the
+        # content checks skip a full reload; round-trip fidelity is covered
+        # by test_output_file_is_valid_xlsx
+        wb = generate_report(str(hecvat_xlsx_path), assessment_file, str(output_file))
         ws = wb["START HERE"]
-        qmap = find_question_cells(ws, ws.max_row)
 
-        # Verify None values don't appear as string "None"
-        for row_num in range(1, ws.max_row + 1):
-            for col_num in [3, 4]:  # Columns C and D
-                cell_value = ws.cell(row=row_num, column=col_num).value
+        # Verify None values don't appear as string "None"; values_only
+        # iteration yields plain tuples instead of a Cell object per probe
+        rows = ws.iter_rows(min_col=3, max_col=4, values_only=True)
+        for row_num, (cell_c, cell_d) in enumerate(rows, start=1):
+            for col_num, cell_value in ((3, cell_c), (4, cell_d)):
                 if cell_value:
                     assert "None" != str(cell_value), \
                         f"Cell ({row_num}, {col_num}) contains string 'None'"
@@ -475,44 +427,30 @@ class TestGenerateReportSheetCoverage:
     questions on certain sheets.
     """
 
-    def test_all_response_sheets_are_processed(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_all_response_sheets_are_processed(self, filled_sample_workbook):
         """Verify all response sheets can be processed without errors.
 
         WHY: If sheet processing fails for any sheet, questions on that sheet
         would be unfilled. This catches sheet-specific errors.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        # Should process all sheets without exception
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
-
         expected_sheets = [
             "START HERE", "Organization", "Product", "Infrastructure",
             "IT Accessibility", "Case-Specific", "AI", "Privacy"
         ]
 
         for sheet_name in expected_sheets:
-            assert sheet_name in wb.sheetnames, \
+            assert sheet_name in filled_sample_workbook.sheetnames, \
                 f"Expected sheet '{sheet_name}' not found in output"
 
-        wb.close()
-
-    def test_find_question_cells_returns_dict(self, hecvat_xlsx_path):
+    def test_find_question_cells_returns_dict(self, hecvat_workbook):
         """Verify find_question_cells helper function returns proper dict.
 
         WHY: This helper is critical for locating questions. If it fails or
         returns wrong data type, all question filling would fail.
         """
-        wb = openpyxl.load_workbook(str(hecvat_xlsx_path))
-        ws = wb["START HERE"]
+        ws = hecvat_workbook["START HERE"]
 
-        qmap = find_question_cells(ws, ws.max_row)
+        qmap = find_question_cells(ws)
 
         assert isinstance(qmap, dict), f"Expected dict, got {type(qmap)}"
         assert len(qmap) > 0, "Question map is empty"
@@ -523,36 +461,22 @@ class TestGenerateReportSheetCoverage:
             assert isinstance(row_num, int), f"Row number should be int, got {type(row_num)}"
             assert "-" in qid, f"Question ID should contain hyphen: {qid}"
 
-        wb.close()
-
-    def test_at_least_one_question_filled_per_sheet(self, hecvat_xlsx_path, sample_assessment_data, tmp_path):
+    def test_at_least_one_question_filled_per_sheet(self, filled_sample_workbook):
         """Verify at least one question is filled on major sheets.
 
         WHY: If no questions are filled on a sheet, it indicates the question
         lookup or sheet processing failed for that sheet.
         """
-        assessment_file = tmp_path / "assessment.json"
-        output_file = tmp_path / "output.xlsx"
-
-        with open(assessment_file, "w") as f:
-            json.dump(sample_assessment_data, f)
-
-        generate_report(str(hecvat_xlsx_path), str(assessment_file), str(output_file))
-
-        wb = openpyxl.load_workbook(str(output_file))
-
-        # Check that START HERE has at least one filled answer
-        ws = wb["START HERE"]
-        filled_cells = 0
-        for row_num in range(1, ws.max_row + 1):
-            cell_c = ws.cell(row=row_num, column=3).value
-            if cell_c and str(cell_c).strip():
-                filled_cells += 1
+        # Check that START HERE has at least one filled answer; one
+        # values_only pass over column C avoids per-cell Cell construction
+        ws = filled_sample_workbook["START HERE"]
+        filled_cells = sum(
+            1 for (cell_c,) in ws.iter_rows(min_col=3, max_col=3,
+                                            values_only=True)
+            if cell_c and str(cell_c).strip())
 
         assert filled_cells > 0, "No answers filled on START HERE sheet"
 
-        wb.close()
-
 
 class TestFindQuestionCellsFunction:
     """Tests for the find_question_cells helper function.
@@ -561,17 +485,16 @@ class TestFindQuestionCellsFunction:
     row numbers. Bugs here would break all answer filling.
     """
 
-    def test_identifies_valid_question_ids(self, hecvat_xlsx_path):
+    def test_identifies_valid_question_ids(self, hecvat_workbook):
         """Verify function correctly identifies HECVAT question ID format.
 
         WHY: Question IDs must match pattern PREFIX-NN (e.g., AAAI-01).
         False positives would include non-question cells; false negatives
         would skip valid questions.
         """
-        wb = openpyxl.load_workbook(str(hecvat_xlsx_path))
-        ws = wb["START HERE"]
+        ws = hecvat_workbook["START HERE"]
 
-        qmap = find_question_cells(ws, ws.max_row)
+        qmap = find_question_cells(ws)
 
         # All keys should match HECVAT pattern
         for qid in qmap.keys():
@@ -580,18 +503,15 @@ class TestFindQuestionCellsFunction:
             assert parts[0].isalpha(), f"Prefix should be alphabetic: {qid}"
             assert parts[1].isdigit(), f"Suffix should be numeric: {qid}"
 
-        wb.close()
-
-    def test_maps_to_correct_row_numbers(self, hecvat_xlsx_path):
+    def test_maps_to_correct_row_numbers(self, hecvat_workbook):
         """Verify row numbers in map point to cells containing the question IDs.
 
         WHY: If row numbers are off by one or incorrect, answers would be
         written to wrong rows, corrupting the report.
         """
-        wb = openpyxl.load_workbook(str(hecvat_xlsx_path))
-        ws = wb["START HERE"]
+        ws = hecvat_workbook["START HERE"]
 
-        qmap = find_question_cells(ws, ws.max_row)
+        qmap = find_question_cells(ws)
 
         # Verify a few mappings are correct
         for qid, row_num in list(qmap.items())[:5]:
@@ -601,8 +521,6 @@ class TestFindQuestionCellsFunction:
             assert qid in str(cell_value).strip(), \
                 f"Row {row_num} should contain '{qid}', got '{cell_value}'"
 
-        wb.close()
-
     def test_handles_empty_worksheet(self):
         """Verify function returns empty dict for empty worksheet.
 
@@ -613,7 +531,7 @@ class TestFindQuestionCellsFunction:
         wb = openpyxl.Workbook()
         ws = wb.active
 
-        qmap = find_question_cells(ws, ws.max_row)
+        qmap = find_question_cells(ws)
 
         assert isinstance(qmap, dict)
         assert len(qmap) == 0, "Empty worksheet should produce empty question map"